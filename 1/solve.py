@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 
 
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import read_lines
+
 REPLACEMENTS = [
     ("one", "o1e"),
     ("two", "t2o"),
@@ -14,11 +21,6 @@ REPLACEMENTS = [
 ]
 
 
-def read_file(filename="input.txt"):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def replace_words(lines):
     new_lines = []
     for line in lines:
@@ -54,8 +56,8 @@ def sum_lines(lines):
     return sum(extract_pairs(lines))
 
 
-def main():
-    lines = read_file()
+def main(filename="input.txt"):
+    lines = read_lines(filename)
     lines_numeric = replace_words(lines)
     print(f"part 1:  {sum_lines(lines)}")
     print(f"part 2:  {sum_lines(lines_numeric)}")
@@ -1,8 +1,20 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 import networkx as nx
-from time import sleep
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import bfs, grid, instrument
+from aoc.grid import DOT
+from aoc.render import FrameRenderer
+
+START = ord("S")
+SPACE = ord(" ")
+OUTSIDE = ord("O")
 
 
 class Position(tuple):
@@ -24,70 +36,37 @@ class Position(tuple):
 
 
 class PipeGraph(nx.Graph):
-    CONNECT_NORTH = {"┐", "┌", "│", "S"}
-    CONNECT_SOUTH = {"┘", "└", "│", "S"}
-    CONNECT_WEST = {"┌", "└", "─", "S"}
-    CONNECT_EAST = {"┐", "┘", "─", "S"}
+    CONNECT_NORTH = {ord(char) for char in "7F|S"}
+    CONNECT_SOUTH = {ord(char) for char in "JL|S"}
+    CONNECT_WEST = {ord(char) for char in "FL-S"}
+    CONNECT_EAST = {ord(char) for char in "7J-S"}
     CHAR_MAP = {
-        "|": "│",
-        "-": "─",
-        "L": "└",
-        "J": "┘",
-        "F": "┌",
-        "7": "┐",
+        ord("|"): "│",
+        ord("-"): "─",
+        ord("L"): "└",
+        ord("J"): "┘",
+        ord("F"): "┌",
+        ord("7"): "┐",
     }
     EXPAND_CHAR_MAP = {
-        "│": np.array(
-            (
-                ["│", " "],
-                ["│", " "],
-            )
-        ),
-        "─": np.array(
-            (
-                ["─", "─"],
-                [" ", " "],
-            )
-        ),
-        "└": np.array(
-            (
-                ["└", "─"],
-                [" ", " "],
-            )
-        ),
-        "┘": np.array(
-            (
-                ["┘", " "],
-                [" ", " "],
-            )
-        ),
-        "┌": np.array(
-            (
-                ["┌", "─"],
-                ["│", " "],
-            )
-        ),
-        "┐": np.array(
-            (
-                ["┐", " "],
-                ["│", " "],
-            )
-        ),
-        ".": np.array(
-            (
-                [".", " "],
-                [" ", " "],
-            )
-        ),
+        ord(char): grid.codes("".join(tile)).reshape(2, 2)
+        for char, tile in {
+            "|": ("| ", "| "),
+            "-": ("--", "  "),
+            "L": ("L-", "  "),
+            "J": ("J ", "  "),
+            "F": ("F-", "| "),
+            "7": ("7 ", "| "),
+            ".": (". ", "  "),
+        }.items()
     }
-    TRAVERSABLE = {".", " "}
+    TRAVERSABLE = {DOT, SPACE}
 
-    def __init__(self, board):
+    def __init__(self, board, renderer=None):
         super().__init__()
-        self.queue = None
-        self.board = np.pad(board, 1, constant_values=".")
+        self.renderer = renderer
+        self.board = grid.pad(board)
         self.start = self._get_start()
-        self._replace_chars()
         self._replace_start()
         self._bfs()
         self._replace_junk()
@@ -96,62 +75,54 @@ class PipeGraph(nx.Graph):
         return len(self.nodes)
 
     def _get_start(self):
-        return Position(map(int, np.where(self.board == "S")))
-
-    def _replace_chars(self):
-        for old, new in self.CHAR_MAP.items():
-            self.board[self.board == old] = new
-            print(self)
-            sleep(0.01)
-
+        return Position(int(idx[0]) for idx in np.where(self.board == START))
 
     def _replace_start(self):
         if self._connected_north(self.start):
             if self._connected_south(self.start):
-                self.board[self.start] = "│"
+                self.board[self.start] = ord("|")
             elif self._connected_west(self.start):
-                self.board[self.start] = "┘"
+                self.board[self.start] = ord("J")
             elif self._connected_east(self.start):
-                self.board[self.start] = "└"
+                self.board[self.start] = ord("L")
         elif self._connected_south(self.start):
             if self._connected_west(self.start):
-                self.board[self.start] = "┐"
+                self.board[self.start] = ord("7")
             elif self._connected_east(self.start):
-                self.board[self.start] = "┌"
+                self.board[self.start] = ord("F")
         else:
-            self.board[self.start] = "─"
-        print(self)
-        sleep(0.01)
+            self.board[self.start] = ord("-")
+        self._show()
 
+    @instrument.timed()
     def _bfs(self):
+        """
+        Find the loop through the start and add its pipes as edges.
+        """
+        moves = self._get_moves()
+        passable = np.ones(self.board.shape, dtype=bool)
+        loop = bfs.get_distances(passable, [self.start], moves=moves) >= 0
         self.add_node(self.start)
-        self.queue = [self.start]
-        while len(self.queue) > 0:
-            pos = self.queue.pop(0)
-            self._check_north(pos)
-            self._check_south(pos)
-            self._check_west(pos)
-            self._check_east(pos)
-
-    def _check_north(self, pos):
-        if self._connected_north(pos) and pos.north not in self.nodes:
-            self.add_edge(pos, pos.north)
-            self.queue.append(pos.north)
-
-    def _check_south(self, pos):
-        if self._connected_south(pos) and pos.south not in self.nodes:
-            self.add_edge(pos, pos.south)
-            self.queue.append(pos.south)
-
-    def _check_west(self, pos):
-        if self._connected_west(pos) and pos.west not in self.nodes:
-            self.add_edge(pos, pos.west)
-            self.queue.append(pos.west)
-
-    def _check_east(self, pos):
-        if self._connected_east(pos) and pos.east not in self.nodes:
-            self.add_edge(pos, pos.east)
-            self.queue.append(pos.east)
+        for (d_row, d_col), move in zip(grid.OFFSETS, moves):
+            for row, col in np.argwhere(loop & move).tolist():
+                pos = Position((row, col))
+                self.add_edge(pos, Position((row + d_row, col + d_col)))
+
+    def _get_moves(self):
+        """
+        Masks of the tiles connected to their east, west, south and north
+        neighbors, in grid.OFFSETS order.  Vectorized _connected_* checks.
+        """
+        north = np.isin(self.board, list(self.CONNECT_NORTH))
+        south = np.isin(self.board, list(self.CONNECT_SOUTH))
+        west = np.isin(self.board, list(self.CONNECT_WEST))
+        east = np.isin(self.board, list(self.CONNECT_EAST))
+        moves = np.zeros((4, *self.board.shape), dtype=bool)
+        moves[0, :, :-1] = west[:, :-1] & east[:, 1:]
+        moves[1, :, 1:] = east[:, 1:] & west[:, :-1]
+        moves[2, :-1] = north[:-1] & south[1:]
+        moves[3, 1:] = south[1:] & north[:-1]
+        return moves
 
     def _connected_north(self, pos):
         return (
@@ -177,18 +148,19 @@ class PipeGraph(nx.Graph):
             and self.board[pos.east] in self.CONNECT_EAST
         )
 
+    @instrument.timed()
     def _replace_junk(self):
         for row in range(self.board.shape[0]):
             for col in range(self.board.shape[1]):
                 if (row, col) not in self.nodes:
-                    self.board[row, col] = "."
-                    print(self)
-                    sleep(0.01)
+                    self.board[row, col] = DOT
+                    self._show()
 
+    @instrument.timed()
     def get_internal_area(self):
         self.board = self._expand()
         self._bfs_external()
-        return (self.board == ".").sum()
+        return (self.board == DOT).sum()
 
     def _expand(self):
         expanded_board = np.empty(
@@ -201,62 +173,49 @@ class PipeGraph(nx.Graph):
                 expanded_board[idx : idx + 2, jdx : jdx + 2] = self.EXPAND_CHAR_MAP[col]
         return expanded_board
 
+    @instrument.timed()
     def _bfs_external(self):
-        self.queue = [Position((0, 0))]
-        while len(self.queue) > 0:
-            pos = self.queue.pop(0)
-            self._bfs_external_north(pos)
-            self._bfs_external_south(pos)
-            self._bfs_external_west(pos)
-            self._bfs_external_east(pos)
-            print(self)
-            sleep(0.01)
-
-    def _bfs_external_north(self, pos):
-        if self.board[pos.north] in self.TRAVERSABLE:
-            self.board[pos.north] = "O"
-            self.queue.append(pos.north)
-
-    def _bfs_external_south(self, pos):
-        if pos.south[0] < self.board.shape[0] and self.board[pos.south] in self.TRAVERSABLE:
-            self.board[pos.south] = "O"
-            self.queue.append(pos.south)
-
-    def _bfs_external_west(self, pos):
-        if self.board[pos.west] in self.TRAVERSABLE:
-            self.board[pos.west] = "O"
-            self.queue.append(pos.west)
-
-    def _bfs_external_east(self, pos):
-        if pos.east[1] < self.board.shape[1] and self.board[pos.east] in self.TRAVERSABLE:
-            self.board[pos.east] = "O"
-            self.queue.append(pos.east)
+        passable = np.isin(self.board, list(self.TRAVERSABLE))
+        distances = bfs.get_distances(passable, [(0, 0)])
+        if self.renderer is None:
+            self.board[distances >= 0] = OUTSIDE
+            return
+        for distance in range(distances.max() + 1):
+            self.board[distances == distance] = OUTSIDE
+            self._show()
+
+    def _show(self):
+        """
+        Offer the current board to the renderer, if rendering.
+        """
+        if self.renderer is not None:
+            self.renderer.submit(self.board.copy)
 
     def __str__(self):
-        return "\n".join("".join(row) for row in self.board)
+        return grid.to_str(self.board, self.CHAR_MAP)
 
     def __repr__(self):
         return str(self)
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
-def parse_board(lines):
-    return np.array([list(line.strip()) for line in lines])
+def parse_board(filename):
+    return grid.load(filename)
 
 
-def main(filename="input.txt"):
-    board = parse_board(read_file(filename))
-    graph = PipeGraph(board)
+def main(filename="input.txt", render=False):
+    board = parse_board(filename)
+    renderer = None
+    if render:
+        renderer = FrameRenderer(lambda board: grid.to_str(board, PipeGraph.CHAR_MAP))
+    graph = PipeGraph(board, renderer)
     print(f"part 1:  {graph.get_path_length() // 2}")
     print(graph)
     print(f"part 2:  {graph.get_internal_area()}")
+    if renderer is not None:
+        renderer.close()
     print(graph)
 
 
 if __name__ == "__main__":
-    main("test4.txt")
+    main("test4.txt", render=True)
     #main()
@@ -1,23 +1,26 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc import grid
+from aoc.grid import HASH
 
 
-def parse_universe(lines):
-    return np.array([list(line.strip()) for line in lines])
+def parse_universe(filename):
+    return grid.load(filename)
 
 
 def universe_str(universe):
-    return "\n".join("".join(row) for row in universe)
+    return grid.to_str(universe)
 
 
 def expand_vertical(universe, expansion, coords):
-    empty_rows = np.argwhere((universe == "#").sum(axis=1) == 0).flatten()
+    empty_rows = np.argwhere((universe == HASH).sum(axis=1) == 0).flatten()
     for empty_row in empty_rows[::-1]:
         for coord in coords:
             if coord[0] > empty_row:
@@ -25,7 +28,7 @@ def expand_vertical(universe, expansion, coords):
 
 
 def expand_horizontal(universe, expansion, coords):
-    empty_cols = np.argwhere((universe == "#").sum(axis=0) == 0).flatten()
+    empty_cols = np.argwhere((universe == HASH).sum(axis=0) == 0).flatten()
     for empty_col in empty_cols[::-1]:
         for coord in coords:
             if coord[1] > empty_col:
@@ -45,14 +48,14 @@ def get_distance(coord_0, coord_1):
 
 
 def get_coords(universe, expansion=1):
-    coords = list(map(list, np.argwhere(universe == "#")))
+    coords = list(map(list, np.argwhere(universe == HASH)))
     expand_horizontal(universe, expansion, coords)
     expand_vertical(universe, expansion, coords)
     return coords
 
 
 def main(filename="input.txt"):
-    universe = parse_universe(read_file(filename))
+    universe = parse_universe(filename)
     print(f"expansion 1:  {sum(get_distances(get_coords(universe)))}")
     print(f"expansion 10:  {sum(get_distances(get_coords(universe, 9)))}")
     print(f"expansion 100:  {sum(get_distances(get_coords(universe, 99)))}")
@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 
 # import re
+import sys
+from pathlib import Path
+
 import regex
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import instrument
+from aoc.inputs import read_lines
+
 
 class Group:
     def __init__(self, seq, broken):
@@ -26,11 +34,6 @@ class Group:
         return regex.sub(r"\.+", ".", seq, count=0).strip(".")
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def parse_groups(lines):
     return [parse_group(line) for line in lines]
 
@@ -41,12 +44,17 @@ def parse_group(line):
     return Group(seq, broken)
 
 
+@instrument.timed()
 def get_counts(groups):
-    return [get_count(group) for group in groups]
+    counts = [get_count(group) for group in groups]
+    # one table row per position of the padded seq, plus the end row
+    cells = sum((len(group.seq) + 3) * len(group.broken) for group in groups)
+    instrument.count("dp cells", cells)
+    return counts
 
 
 def get_count(group):
-    return get_count_recursive("." + group.seq + ".", group.broken, {})
+    return count_arrangements("." + group.seq + ".", group.broken)
 
 
 def unfold_groups(groups):
@@ -54,46 +62,43 @@ def unfold_groups(groups):
         group.unfold()
 
 
-def get_count_recursive(seq, broken, cache):
-    if get_termination_value(seq, broken) is not None:
-        return get_termination_value(seq, broken)
-    if (seq, broken) not in cache:
-        cache[(seq, broken)] = dfs(seq, broken, cache)
-    return cache[(seq, broken)]
-
-
-def get_termination_value(seq, broken):
-    if len(broken) == 0:
-        if seq.count("#") == 0:
-            return 1
-        return 0
-    if len(seq) == 0:
-        return 0
-    return None
-
-
-def get_leftmost(seq, sub):
+def get_runs(seq):
     """
-    find() but default value is len(seq).
+    Length of the run of "#" and "?" starting at each position, and the
+    position of the first "#" at or after each one, len(seq) if none.
     """
-    return len(seq) if seq.find(sub) == -1 else seq.find(sub)
-
+    runs = [0] * (len(seq) + 1)
+    next_hash = [len(seq)] * (len(seq) + 1)
+    for idx in range(len(seq) - 1, -1, -1):
+        runs[idx] = runs[idx + 1] + 1 if seq[idx] != "." else 0
+        next_hash[idx] = idx if seq[idx] == "#" else next_hash[idx + 1]
+    return runs, next_hash
 
-def get_pattern(length):
-    return f"[?.]([?#]{{{length}}})[?.]"
 
-
-def dfs(seq, broken, cache):
-    count = 0
-    for match in regex.finditer(get_pattern(broken[0]), seq, overlapped=True):
-        if match.span()[0] > get_leftmost(seq, "#"):
-            break
-        count += get_count_recursive(seq[match.span()[1] - 1 :], broken[1:], cache)
-    return count
+def count_arrangements(seq, broken):
+    """
+    counts[idx][jdx] is the number of ways to place groups broken[jdx:] in
+    seq[idx:].  Rows are filled from the end:  either seq[idx] is working,
+    unless it is "#", or group jdx starts at idx, if the run from idx fits it
+    and the spring after it can be working.  seq must end with ".".
+    """
+    runs, next_hash = get_runs(seq)
+    n_groups = len(broken)
+    counts = [[0] * (n_groups + 1) for _ in range(len(seq) + 2)]
+    for idx in range(len(seq), -1, -1):
+        row, skip = counts[idx], counts[idx + 1]
+        row[n_groups] = 1 if next_hash[idx] == len(seq) else 0
+        for jdx, length in enumerate(broken):
+            count = skip[jdx] if next_hash[idx] != idx else 0
+            end = idx + length
+            if runs[idx] >= length and end < len(seq) and seq[end] != "#":
+                count += counts[end + 1][jdx + 1]
+            row[jdx] = count
+    return counts[0][0]
 
 
 def main(filename="input.txt"):
-    groups = parse_groups(read_file(filename))
+    groups = parse_groups(read_lines(filename))
     print(f"part 1:  {sum(get_counts(groups))}")
     unfold_groups(groups)
     print(f"part 2:  {sum(get_counts(groups))}")
@@ -1,57 +1,69 @@
 #!/usr/bin/env python3
 
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.read()
+from aoc import grid
+from aoc.grid import HASH
+from aoc.inputs import read_grids, stream_grids
 
 
-def parse_patterns(data):
-    return [parse_pattern(section) for section in data.split("\n\n")]
+def parse_patterns(filename):
+    return read_grids(filename)
 
 
-def parse_pattern(section):
-    return np.array([list(line) for line in section.split()])
+def array_str(array):
+    return grid.to_str(array)
 
 
-def array_str(array):
-    return "\n".join("".join(row) for row in array)
+def encode(mask):
+    """
+    Each row of a boolean mask as an integer, cell jdx as bit jdx.
+    """
+    packed = np.packbits(mask, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
 
 
-def check_top_down_fold(array, idx):
+def get_masks(array):
     """
-    Fold top section over bottom section.  Return true if symmetrical.
-    Slice, reverse top, truncate to common height, test equivalency.
+    Rows and columns of a pattern as bitmasks of its # cells.
     """
-    top = array[:idx][::-1]
-    bot = array[idx:]
-    n_rows = min(top.shape[0], bot.shape[0])
-    top = top[:n_rows]
-    bot = bot[:n_rows]
-    return (top == bot).all()
+    mask = array == HASH
+    return encode(mask), encode(mask.T)
 
 
-def check_left_right_fold(array, idx):
+def count_mismatches(masks, idx):
     """
-    Fold left section over right section.  Return true if symmetrical.
-    Slice, reverse left, truncate to common width, test equivalency.
+    Fold the masks before idx over those from idx on and count the cells
+    that differ, as the popcount of each mirrored pair's XOR.
     """
-    left = array[:, :idx][:, ::-1]
-    right = array[:, idx:]
-    n_cols = min(left.shape[1], right.shape[1])
-    left = left[:, :n_cols]
-    right = right[:, :n_cols]
-    return (left == right).all()
+    pairs = zip(reversed(masks[:idx]), masks[idx:])
+    return sum((first ^ second).bit_count() for first, second in pairs)
+
 
+def check_fold(masks, idx):
+    return all(
+        first == second for first, second in zip(reversed(masks[:idx]), masks[idx:])
+    )
 
-def get_fold_rows(array):
-    return {row for row in range(1, array.shape[0]) if check_top_down_fold(array, row)}
 
+def get_folds(masks):
+    return {idx for idx in range(1, len(masks)) if check_fold(masks, idx)}
 
-def get_fold_cols(array):
-    return {col for col in range(1, array.shape[1]) if check_left_right_fold(array, col)}
+
+def get_smudged_folds(masks):
+    """
+    Folds that hold once exactly one cell is flipped, so exactly one cell
+    mismatches across them.  These are never folds of the unsmudged pattern.
+    """
+    return {idx for idx in range(1, len(masks)) if count_mismatches(masks, idx) == 1}
 
 
 def get_value(rows, cols):
@@ -61,49 +73,63 @@ def get_value(rows, cols):
 def get_summary(arrays):
     summary = 0
     for array in arrays:
-        rows = get_fold_rows(array)
-        cols = get_fold_cols(array)
-        summary += get_value(rows, cols)
+        row_masks, col_masks = get_masks(array)
+        summary += get_value(get_folds(row_masks), get_folds(col_masks))
     return summary
 
 
 def get_smudge_summary(arrays):
     summary = 0
     for array in arrays:
-        rows = get_smudged_rows(array) - get_fold_rows(array)
-        cols = get_smudged_cols(array) - get_fold_cols(array)
+        row_masks, col_masks = get_masks(array)
+        rows = get_smudged_folds(row_masks)
+        cols = get_smudged_folds(col_masks)
         summary += get_value(rows, cols)
     return summary
 
 
-def smudges(array):
-    for idx, row in enumerate(array):
-        for jdx, col in enumerate(row):
-            smudged = array.copy()
-            smudged[idx, jdx] = "#" if col == "." else "."
-            yield smudged
-
-
-def get_smudged_rows(array):
-    rows = set()
-    for smudged in smudges(array):
-        rows |= get_fold_rows(smudged)
-    return rows
+def get_summaries(arrays):
+    return get_summary(arrays), get_smudge_summary(arrays)
 
 
-def get_smudged_cols(array):
-    cols = set()
-    for smudged in smudges(array):
-        cols |= get_fold_cols(smudged)
-    return cols
-
-
-def main(filename="input.txt"):
-    patterns = parse_patterns(read_file(filename))
-    print(f"part 1:  {get_summary(patterns)}")
-    print(f"part 2:  {get_smudge_summary(patterns)}")
+def stream_summaries(filename, jobs=0, batch_size=1000):
+    """
+    Both summaries of a pattern file, with the patterns read lazily and
+    summarized in batches across a pool of jobs workers, or one per core
+    for 0.  At most two batches per worker are in flight, so memory stays
+    bounded however many patterns the file holds.
+    """
+    jobs = jobs or os.cpu_count()
+    patterns = stream_grids(filename)
+    summary = smudge_summary = 0
+    pending = set()
+    with ProcessPoolExecutor(jobs) as executor:
+        while True:
+            while len(pending) < 2 * jobs:
+                batch = list(islice(patterns, batch_size))
+                if len(batch) == 0:
+                    break
+                pending.add(executor.submit(get_summaries, batch))
+            if len(pending) == 0:
+                return summary, smudge_summary
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_summary, batch_smudge_summary = future.result()
+                summary += batch_summary
+                smudge_summary += batch_smudge_summary
+
+
+def main(filename="input.txt", jobs=None):
+    if jobs is not None:
+        summary, smudge_summary = stream_summaries(filename, jobs)
+    else:
+        patterns = parse_patterns(filename)
+        summary, smudge_summary = get_summaries(patterns)
+    print(f"part 1:  {summary}")
+    print(f"part 2:  {smudge_summary}")
 
 
 if __name__ == "__main__":
     main("test.txt")
     main()
+    main(jobs=0)
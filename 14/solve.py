@@ -1,74 +1,173 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc import grid, instrument
+from aoc.grid import DOT, HASH
 
+ROUND = ord("O")
 
-def parse_array(lines):
-    return np.array([list(line.strip()) for line in lines])
+NORTH, WEST, SOUTH, EAST = range(4)
+SPIN = (NORTH, WEST, SOUTH, EAST)
 
+_SEGMENTS = {}
 
-def array_str(array):
-    return "\n".join("".join(row) for row in array)
 
+def parse_array(filename):
+    return grid.load(filename)
 
-def shift_north(array):
-    for idx, row in enumerate(array[1:], start=1):
-        for jdx, col in enumerate(row):
-            if col == "O":
-                dst = get_empty_north(array, idx, jdx)
-                array[idx, jdx] = "."
-                array[dst, jdx] = "O"
+
+def array_str(array):
+    return grid.to_str(array)
+
+
+def get_view(array, direction):
+    """
+    View of array turned so that direction points to row 0, so tilting the
+    view north tilts array in direction.  Views write through to array.
+    """
+    if direction == NORTH:
+        return array
+    if direction == WEST:
+        return array.T
+    if direction == SOUTH:
+        return array[::-1]
+    return array[:, ::-1].T
+
+
+def get_segments(array, direction):
+    """
+    Split each column of the view for direction into segments between cube
+    rocks.  Returns each cell's segment number and its distance from the
+    segment's top, where tilted round rocks pile up.  The cube rocks never
+    move, so these are cached by their layout, one board at a time.
+    """
+    cubes = array == HASH
+    key = (cubes.shape, np.packbits(cubes).tobytes())
+    if key not in _SEGMENTS:
+        _SEGMENTS.clear()  # one board at a time
+        _SEGMENTS[key] = {}
+    tables = _SEGMENTS[key]
+    if direction not in tables:
+        cubes = get_view(cubes, direction)
+        height, width = cubes.shape
+        rows = np.arange(height)[:, None]
+        last_cube = np.maximum.accumulate(np.where(cubes, rows, -1), axis=0)
+        segments = np.arange(width) * (height + 1) + last_cube + 1
+        tables[direction] = segments, rows - last_cube - 1
+    return tables[direction]
+
+
+def tilt(array, direction):
+    """
+    Roll every round rock as far as it goes in direction, in place:  count
+    the round rocks in each segment and refill each segment from its top.
+    """
+    segments, offsets = get_segments(array, direction)
+    view = get_view(array, direction)
+    rounds = view == ROUND
+    n_segments = segments.size + segments.shape[1]  # height + 1 per column
+    counts = np.bincount(segments[rounds], minlength=n_segments)
+    view[rounds] = DOT
+    view[(view != HASH) & (offsets < counts[segments])] = ROUND
     return array
 
 
-def get_empty_north(array, idx, jdx):
-    while idx > 0 and array[idx - 1, jdx] == ".":
-        idx -= 1
-    return idx
+def shift_north(array):
+    return tilt(array, NORTH)
 
 
 def get_load(array):
     load = 0
     for idx, row in enumerate(array[::-1], start=1):
-        load += idx * (row == "O").sum()
+        load += idx * (row == ROUND).sum()
     return load
 
 
 def spin(array, rotations):
     for _ in range(rotations):
-        for _ in range(4):  # rotate through 4 directions
-            array = shift_north(array)
-            array = np.rot90(array, k=-1)
+        for direction in SPIN:
+            tilt(array, direction)
     return array
 
 
-def hash_array(array):
-    return hash("".join(array.flatten()))
-
-
-def find_hash_cycle(array):
-    array_hash = hash_array(array)
-    idx = 0
-    cache = {}
-    while array_hash not in cache:
-        cache[array_hash] = idx
-        array = spin(array, 1)
-        array_hash = hash_array(array)
-        idx += 1
-    return cache[array_hash], idx - cache[array_hash]
-
-
-def main(filename="input.txt"):
-    array = parse_array(read_file(filename))
+def get_key(array):
+    """
+    The round rock positions packed one bit per cell.  The cube rocks never
+    move, so this identifies the state exactly.
+    """
+    return np.packbits(array == ROUND).tobytes()
+
+
+@instrument.timed()
+def find_cycle(array):
+    """
+    Spin until a state repeats.  Returns the first spin of the cycle, its
+    length and the load after each spin so far, starting from no spins.
+    """
+    seen = {}
+    loads = []
+    key = get_key(array)
+    while key not in seen:
+        seen[key] = len(loads)
+        loads.append(get_load(array))
+        key = get_key(spin(array, 1))
+    instrument.count("cycles until repeat", len(loads))
+    return seen[key], len(loads) - seen[key], loads
+
+
+@instrument.timed()
+def find_cycle_brent(array):
+    """
+    Same cycle as find_cycle by Brent's algorithm, holding two states
+    instead of one per spin, at the cost of spinning up to the cycle again.
+    Returns the first spin of the cycle, its length and the state there.
+    """
+    tortoise, hare = array.copy(), spin(array.copy(), 1)
+    power = length = 1
+    while get_key(tortoise) != get_key(hare):
+        if power == length:
+            tortoise[:] = hare
+            power *= 2
+            length = 0
+        spin(hare, 1)
+        length += 1
+
+    tortoise, hare = array.copy(), spin(array.copy(), length)
+    start = 0
+    while get_key(tortoise) != get_key(hare):
+        spin(tortoise, 1)
+        spin(hare, 1)
+        start += 1
+    instrument.count("cycles until repeat", start + length)
+    return start, length, tortoise
+
+
+def get_spin_load(array, cycles, brent=False):
+    """
+    Load after cycles spins.  Past the cycle the load is read from the spins
+    already made, or with brent from at most one more turn of the cycle.
+    """
+    if brent:
+        start, length, state = find_cycle_brent(array)
+        if cycles < start:
+            return get_load(spin(array.copy(), cycles))
+        return get_load(spin(state, (cycles - start) % length))
+    start, length, loads = find_cycle(array.copy())
+    if cycles < len(loads):
+        return loads[cycles]
+    return loads[start + (cycles - start) % length]
+
+
+def main(filename="input.txt", brent=False):
+    array = parse_array(filename)
     print(f"part 1:  {get_load(shift_north(array.copy()))}")
-    cycle_start, cycle_length = find_hash_cycle(array.copy())
-    rotations = cycle_start + (1000000000 - cycle_start) % cycle_length
-    print(f"part 2:  {get_load(spin(array.copy(), rotations))}")
+    print(f"part 2:  {get_spin_load(array, 1000000000, brent)}")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse_instructions(lines):
@@ -48,7 +49,7 @@ def get_boxes(instructions):
 
 
 def main(filename="input.txt"):
-    instructions = parse_instructions(read_file(filename))
+    instructions = parse_instructions(read_lines(filename))
     print(f"part 1:  {sum(hash_iterable(instructions))}")
     print(f"part 2:  {sum(get_focus_powers(get_boxes(instructions)))}")
 
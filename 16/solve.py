@@ -1,25 +1,91 @@
 #!/usr/bin/env python3
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
 import numpy as np
 
-sys.setrecursionlimit(9999)
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import grid, instrument
+from aoc.grid import DOT, HASH
+
+VERTICAL = ord("|")
+HORIZONTAL = ord("-")
+BACKSLASH = ord("\\")
+SLASH = ord("/")
+
+# beam directions, as bit positions in the energized masks
+EAST, NORTH, SOUTH, WEST = range(4)
+DIRECTION_NAMES = ("east", "north", "south", "west")
+D_ROWS = (0, -1, 1, 0)
+D_COLS = (1, 0, 0, -1)
+
+
+def get_transitions():
+    """
+    Table of the directions a beam leaves a tile in, as a bitmask indexed by
+    tile byte and the direction the beam entered in.
+    """
+    transitions = np.zeros((256, 4), dtype=np.uint8)
+    transitions[:, EAST] = 1 << EAST
+    transitions[:, NORTH] = 1 << NORTH
+    transitions[:, SOUTH] = 1 << SOUTH
+    transitions[:, WEST] = 1 << WEST
+    transitions[VERTICAL, [EAST, WEST]] = 1 << NORTH | 1 << SOUTH
+    transitions[HORIZONTAL, [NORTH, SOUTH]] = 1 << EAST | 1 << WEST
+    transitions[BACKSLASH, [EAST, NORTH, SOUTH, WEST]] = [
+        1 << SOUTH,
+        1 << WEST,
+        1 << EAST,
+        1 << NORTH,
+    ]
+    transitions[SLASH, [EAST, NORTH, SOUTH, WEST]] = [
+        1 << NORTH,
+        1 << EAST,
+        1 << WEST,
+        1 << SOUTH,
+    ]
+    return transitions
+
+
+TRANSITIONS = get_transitions()
 
+# TRANSITIONS decoded into tuples of directions, flat by tile * 4 + direction
+EXITS = [
+    tuple(d for d in range(4) if mask >> d & 1) for mask in TRANSITIONS.ravel().tolist()
+]
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+
+def parse_board(filename):
+    return grid.load(filename)
+
+
+def get_entries(height, width):
+    """
+    Every beam entering from the edge of the board, as (row, col, direction).
+    """
+    starts = [(idx, 0, EAST) for idx in range(height)]
+    starts += [(idx, width - 1, WEST) for idx in range(height)]
+    starts += [(0, jdx, SOUTH) for jdx in range(width)]
+    starts += [(height - 1, jdx, NORTH) for jdx in range(width)]
+    return starts
 
 
 class Board:
-    def __init__(self, lines):
-        self.board = np.array([list(line.strip()) for line in lines])
-        self.energized = np.zeros_like(self.board, dtype=int)
+    def __init__(self, board):
+        self.board = board
+        self.tiles = board.ravel().tolist()
+        self.energized = np.zeros_like(self.board, dtype=np.uint8)
+        self._seen = memoryview(self.energized).cast("B")  # flat, writes through
 
     def __str__(self):
-        array = np.full_like(self.board, ".")
-        array[(self.energized > 0)] = "#"
-        return "\n".join("".join(row) for row in array)
+        array = np.full_like(self.board, DOT)
+        array[(self.energized > 0)] = HASH
+        return grid.to_str(array)
 
     def __repr__(self):
         return str(self)
@@ -30,123 +96,280 @@ class Board:
     def get_energized(self):
         return (self.energized > 0).sum()
 
-    def get_max_energized(self):
-        max_energized = 0
-        for idx in range(self.board.shape[0]):
-            self.clear_energized()
-            self.walk_east(idx, 0)
-            max_energized = max(max_energized, self.get_energized())
-            self.clear_energized()
-            self.walk_west(idx, self.board.shape[1] - 1)
-            max_energized = max(max_energized, self.get_energized())
-        for jdx in range(self.board.shape[1]):
-            self.clear_energized()
-            self.walk_south(0, jdx)
-            max_energized = max(max_energized, self.get_energized())
-            self.clear_energized()
-            self.walk_north(self.board.shape[0] - 1, jdx)
-            max_energized = max(max_energized, self.get_energized())
-        return max_energized
-
-    def valid_coords(self, idx, jdx):
-        return idx in range(self.board.shape[0]) and jdx in range(self.board.shape[1])
-
-    def walk_east(self, idx, jdx):
-        if not self.valid_coords(idx, jdx) or self.visited_east(idx, jdx):
-            return
-        if self.board[idx, jdx] == "|":
-            self.walk_north(idx - 1, jdx)
-            self.walk_south(idx + 1, jdx)
-        elif self.board[idx, jdx] == "\\":
-            self.walk_south(idx + 1, jdx)
-        elif self.board[idx, jdx] == "/":
-            self.walk_north(idx - 1, jdx)
-        else:
-            self.walk_east(idx, jdx + 1)
-
-    def walk_north(self, idx, jdx):
-        if not self.valid_coords(idx, jdx) or self.visited_north(idx, jdx):
-            return
-        if self.board[idx, jdx] == "-":
-            self.walk_west(idx, jdx - 1)
-            self.walk_east(idx, jdx + 1)
-        elif self.board[idx, jdx] == "\\":
-            self.walk_west(idx, jdx - 1)
-        elif self.board[idx, jdx] == "/":
-            self.walk_east(idx, jdx + 1)
-        else:
-            self.walk_north(idx - 1, jdx)
-
-    def walk_south(self, idx, jdx):
-        if not self.valid_coords(idx, jdx) or self.visited_south(idx, jdx):
-            return
-        if self.board[idx, jdx] == "-":
-            self.walk_west(idx, jdx - 1)
-            self.walk_east(idx, jdx + 1)
-        elif self.board[idx, jdx] == "\\":
-            self.walk_east(idx, jdx + 1)
-        elif self.board[idx, jdx] == "/":
-            self.walk_west(idx, jdx - 1)
-        else:
-            self.walk_south(idx + 1, jdx)
-
-    def walk_west(self, idx, jdx):
-        if not self.valid_coords(idx, jdx) or self.visited_west(idx, jdx):
-            return
-        if self.board[idx, jdx] == "|":
-            self.walk_north(idx - 1, jdx)
-            self.walk_south(idx + 1, jdx)
-        elif self.board[idx, jdx] == "\\":
-            self.walk_north(idx - 1, jdx)
-        elif self.board[idx, jdx] == "/":
-            self.walk_south(idx + 1, jdx)
-        else:
-            self.walk_west(idx, jdx - 1)
-
-    def visited_east(self, idx, jdx):
+    @instrument.timed()
+    def get_best_entry(self, jobs=None):
+        """
+        Most cells energized by a beam entering from the edge, and that entry.
+        With jobs, every entry is traced across a process pool of that many
+        workers, or one per core for 0, instead of being read off a BeamGraph.
+        """
+        if jobs is not None:
+            return trace_entries_parallel(self.board, jobs)
+        return BeamGraph(self.board).get_best_entry()
+
+    def get_max_energized(self, jobs=None):
+        return self.get_best_entry(jobs)[0]
+
+    def trace(self, row, col, direction=EAST):
         """
-        Return true if location has been visited while going east.
-        Mark as visited.
+        Follow a beam entering (row, col) in direction, marking each cell's
+        energized mask with the directions beams crossed it in.  Splits are
+        pushed onto a stack and the current beam carries on, so the depth
+        doesn't grow with the board.
         """
-        res = (self.energized[idx, jdx] & 0b0001) > 0
-        self.energized[idx, jdx] |= 0b0001
-        return res
+        height, width = self.board.shape
+        tiles, seen = self.tiles, self._seen
+        stack = [(row, col, direction)]
+        while len(stack) > 0:
+            row, col, direction = stack.pop()
+            while 0 <= row < height and 0 <= col < width:
+                idx = row * width + col
+                bit = 1 << direction
+                if seen[idx] & bit:
+                    break  # beam already traced from here
+                seen[idx] |= bit
+                direction, *others = EXITS[tiles[idx] * 4 + direction]
+                for other in others:
+                    stack.append((row + D_ROWS[other], col + D_COLS[other], other))
+                row += D_ROWS[direction]
+                col += D_COLS[direction]
+
 
-    def visited_north(self, idx, jdx):
+def get_components(successors):
+    """
+    Strongly connected components of a graph given as successor lists, by
+    Tarjan's algorithm with an explicit stack.  Components are numbered in
+    the order they complete, so every edge leads to the same or a lower one.
+    """
+    index = [-1] * len(successors)
+    low = [0] * len(successors)
+    on_stack = [False] * len(successors)
+    component = [-1] * len(successors)
+    stack = []
+    n_indexed = 0
+    n_components = 0
+    for root in range(len(successors)):
+        if index[root] >= 0:
+            continue
+        work = [(root, 0)]  # node and the next successor to look at
+        while len(work) > 0:
+            node, pos = work.pop()
+            if pos == 0:
+                index[node] = low[node] = n_indexed
+                n_indexed += 1
+                stack.append(node)
+                on_stack[node] = True
+            for kdx in range(pos, len(successors[node])):
+                succ = successors[node][kdx]
+                if index[succ] < 0:
+                    work.append((node, kdx + 1))
+                    work.append((succ, 0))
+                    break
+                if on_stack[succ]:
+                    low[node] = min(low[node], index[succ])
+            else:
+                if low[node] == index[node]:
+                    member = None
+                    while member != node:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = n_components
+                    n_components += 1
+                if len(work) > 0:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+    return component, n_components
+
+
+class BeamGraph:
+    """
+    The beam paths of a board as a graph of straight runs.  A run enters a
+    cell in a direction and ends at the first tile that turns or splits the
+    beam, or at the edge of the board.  Its successors are the runs leaving
+    that tile.
+
+    Runs on a loop form one strongly connected component.  Each component
+    gets the bitset of the cells energized from it, the union of its own
+    runs' cells and those of the components it leads to, so the answer for
+    any entry is the popcount of its run's component.  Bitsets are only
+    kept until the components leading to them have been filled.
+    """
+
+    def __init__(self, board):
+        self.height, self.width = board.shape
+        self.tiles = board.ravel().tolist()
+        self.runs = {}  # (row, col, direction) -> run index
+        self.cells = []  # lowest and highest cell index of each run
+        self.successors = []
+        for start in get_entries(self.height, self.width):
+            self.add_runs(start)
+        self.successors = [
+            [self.runs[succ] for succ in successors] for successors in self.successors
+        ]
+        self.component, n_components = get_components(self.successors)
+        self.counts = self.count_components(n_components)
+        instrument.count("beam runs", len(self.cells))
+        instrument.count("beam components", n_components)
+
+    def add_runs(self, start):
         """
-        Return true if location has been visited while going north.
-        Mark as visited.
+        Add the run from start and every run reachable from it, with their
+        successors as starts until every run has an index.
         """
-        res = (self.energized[idx, jdx] & 0b0010) > 0
-        self.energized[idx, jdx] |= 0b0010
-        return res
+        pending = [start]
+        while len(pending) > 0:
+            start = pending.pop()
+            if start in self.runs:
+                continue
+            self.runs[start] = len(self.cells)
+            row, col, direction = start
+            first = row * self.width + col
+            exits = (direction,)
+            while exits == (direction,) and (
+                0 <= row < self.height and 0 <= col < self.width
+            ):
+                idx = row * self.width + col
+                exits = EXITS[self.tiles[idx] * 4 + direction]
+                row += D_ROWS[direction]
+                col += D_COLS[direction]
+            row -= D_ROWS[direction]  # back to the last cell of the run
+            col -= D_COLS[direction]
+            successors = []
+            if exits != (direction,):
+                for out in exits:
+                    succ = (row + D_ROWS[out], col + D_COLS[out], out)
+                    if 0 <= succ[0] < self.height and 0 <= succ[1] < self.width:
+                        successors.append(succ)
+            self.cells.append((min(first, idx), max(first, idx)))
+            self.successors.append(successors)
+            pending.extend(successors)
 
-    def visited_south(self, idx, jdx):
+    def get_run_cells(self, run):
         """
-        Return true if location has been visited while going south.
-        Mark as visited.
+        Bitset of the cells of a run, from its lowest and highest cell.
         """
-        res = (self.energized[idx, jdx] & 0b0100) > 0
-        self.energized[idx, jdx] |= 0b0100
-        return res
+        low, high = self.cells[run]
+        if high - low < self.width and low // self.width == high // self.width:
+            return ((1 << (high - low + 1)) - 1) << low
+        cells = 0
+        for idx in range(low, high + 1, self.width):
+            cells |= 1 << idx
+        return cells
 
-    def visited_west(self, idx, jdx):
+    def count_components(self, n_components):
         """
-        Return true if location has been visited while going west.
-        Mark as visited.
+        Number of cells energized from each component that an edge entry
+        starts in.  Components are visited successors first.  A component's
+        bitset is dropped once every component leading to it has used it, so
+        only the bitsets still awaiting a predecessor are alive at once.
         """
-        res = (self.energized[idx, jdx] & 0b1000) > 0
-        self.energized[idx, jdx] |= 0b1000
-        return res
+        members = [[] for _ in range(n_components)]
+        successors = [set() for _ in range(n_components)]
+        for run, component in enumerate(self.component):
+            members[component].append(run)
+            for succ in self.successors[run]:
+                if self.component[succ] != component:
+                    successors[component].add(self.component[succ])
+        waiting = [0] * n_components  # predecessors yet to use each bitset
+        for succs in successors:
+            for succ in succs:
+                waiting[succ] += 1
+        entries = {
+            self.component[self.runs[start]]
+            for start in get_entries(self.height, self.width)
+        }
+
+        energized = {}
+        counts = {}
+        for component in range(n_components):
+            cells = 0
+            for run in members[component]:
+                cells |= self.get_run_cells(run)
+            for succ in successors[component]:
+                cells |= energized[succ]
+                waiting[succ] -= 1
+                if waiting[succ] == 0:
+                    del energized[succ]
+            if component in entries:
+                counts[component] = cells.bit_count()
+            if waiting[component] > 0:
+                energized[component] = cells
+        return counts
+
+    def count_energized(self, start):
+        return self.counts[self.component[self.runs[start]]]
+
+    def get_best_entry(self):
+        return max(
+            (
+                (self.count_energized(start), start)
+                for start in get_entries(self.height, self.width)
+            ),
+            key=lambda item: item[0],
+        )
+
+
+_WORKER = {}
+
+
+def _attach_board(name, shape):
+    """
+    Pool initializer:  view the shared board read-only and give this worker
+    its own Board, and so its own energized buffer.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    board = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+    board.flags.writeable = False
+    _WORKER["memory"] = memory  # keep the mapping alive
+    _WORKER["board"] = Board(board)
+
+
+def _trace_entries(entries):
+    board = _WORKER["board"]
+    best = (0, None)
+    for entry in entries:
+        board.clear_energized()
+        board.trace(*entry)
+        energized = int(board.get_energized())
+        best = max(best, (energized, entry), key=lambda item: item[0])
+    return best
+
+
+def trace_entries_parallel(board, jobs=0):
+    """
+    Trace every edge entry across a pool of jobs workers, or one per core,
+    and return the most cells energized and the first entry reaching it.
+    The board is copied once into shared memory instead of to each task.
+    """
+    jobs = jobs or os.cpu_count()
+    entries = get_entries(*board.shape)
+    size = -(-len(entries) // (4 * jobs))  # a few chunks per worker
+    chunks = [entries[idx : idx + size] for idx in range(0, len(entries), size)]
+    memory = shared_memory.SharedMemory(create=True, size=board.nbytes)
+    try:
+        shared = np.ndarray(board.shape, dtype=np.uint8, buffer=memory.buf)
+        shared[:] = board
+        del shared  # the mapping can't close while viewed
+        with ProcessPoolExecutor(
+            jobs, initializer=_attach_board, initargs=(memory.name, board.shape)
+        ) as executor:
+            results = list(executor.map(_trace_entries, chunks))
+    finally:
+        memory.close()
+        memory.unlink()
+    return max(results, key=lambda item: item[0])
 
 
-def main(filename="input.txt"):
-    board = Board(read_file(filename))
-    board.walk_east(0, 0)
+def main(filename="input.txt", jobs=None):
+    board = Board(parse_board(filename))
+    board.trace(0, 0, EAST)
     print(f"part 1:  {board.get_energized()}")
-    print(f"part 2:  {board.get_max_energized()}")
+    energized, (row, col, direction) = board.get_best_entry(jobs)
+    print(f"part 2:  {energized}")
+    print(f"    entering at {row}, {col} heading {DIRECTION_NAMES[direction]}")
 
 
 if __name__ == "__main__":
     main("test.txt")
     main()
+    main(jobs=0)
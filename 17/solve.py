@@ -1,101 +1,273 @@
 #!/usr/bin/env python3
 
+import heapq
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
 import numpy as np
-import networkx as nx
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import instrument
+from aoc.grid import OFFSETS
+from aoc.inputs import read_grid
+
+
+def parse_board(filename):
+    return (read_grid(filename) - ord("0")).astype(int)
+
+
+MODES = ("dijkstra", "astar")
+
+BAND_MOVES = 1 << 20  # padded move slots built at once by get_adjacency
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+_TABLES = {}
 
+H = 0  # next move is horizontal
+V = 1  # next move is vertical
 
-def parse_board(lines):
-    return np.array([list(map(int, list(line.strip()))) for line in lines])
 
+def get_prefix_sums(board):
+    """
+    Sums along the rows and down the columns with a leading zero, so cells
+    a to b - 1 of row weigh row_sums[row, b] - row_sums[row, a].  Cached by
+    board contents, so both parts share them.
+    """
+    key = (board.shape, board.tobytes())
+    if key not in _TABLES:
+        _TABLES.clear()  # one board at a time
+        _TABLES[key] = (
+            np.pad(board.cumsum(axis=1), ((0, 0), (1, 0))),
+            np.pad(board.cumsum(axis=0), ((1, 0), (0, 0))),
+        )
+    return _TABLES[key]
+
+
+@dataclass
+class SearchStats:
+    mode: str
+    weight: int = None
+    expanded: int = 0
+    pushed: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.mode}:  weight {self.weight}, {self.expanded} states expanded,"
+            f" {self.pushed} pushed"
+        )
+
+
+class CrucibleGraph:
+    """
+    States are (row, col, orientation) encoded as (row * width + col) * 2 +
+    orientation.  Each move goes min_dst to max_dst cells in the current
+    orientation and flips it.  The moves are built once per graph as compact
+    arrays, with their weights taken from prefix sums of the rows and columns.
+    """
 
-class CrucibleGraph(nx.DiGraph):
     def __init__(self, board, min_dst=1, max_dst=3):
-        super().__init__()
         self.board = board
         self.min_dst = min_dst
         self.max_dst = max_dst
-        self.build_graph()
-
-    def build_graph(self):
-        self.add_start()
-        self.add_end()
-        for idx in range(self.board.shape[0]):
-            for jdx in range(self.board.shape[1]):
-                self.add_north_edges(idx, jdx)
-                self.add_west_edges(idx, jdx)
-                self.add_south_edges(idx, jdx)
-                self.add_east_edges(idx, jdx)
-
-    def add_start(self):
-        self.add_edge("start", self.h_node(0, 0), weight=0)
-        self.add_edge("start", self.v_node(0, 0), weight=0)
-
-    def add_end(self):
-        idx = self.board.shape[0] - 1
-        jdx = self.board.shape[1] - 1
-        self.add_edge(self.h_node(idx, jdx), "end", weight=0)
-        self.add_edge(self.v_node(idx, jdx), "end", weight=0)
-
-    def add_east_edges(self, idx, jdx):
-        weight = self.board[idx, jdx + 1 : jdx + self.min_dst].sum()
-        for kdx in range(jdx + self.min_dst, jdx + self.max_dst + 1):
-            if kdx >= self.board.shape[1]:
-                break
-            weight += self.board[idx, kdx]
-            self.add_edge(self.h_node(idx, jdx), self.v_node(idx, kdx), weight=weight)
-
-    def add_west_edges(self, idx, jdx):
-        weight = self.board[idx, max(0, jdx - self.min_dst + 1) : jdx].sum()
-        for kdx in range(jdx - self.min_dst, jdx - self.max_dst - 1, -1):
-            if kdx < 0:
-                break
-            weight += self.board[idx, kdx]
-            self.add_edge(self.h_node(idx, jdx), self.v_node(idx, kdx), weight=weight)
-
-    def add_south_edges(self, idx, jdx):
-        weight = self.board[idx + 1 : idx + self.min_dst, jdx].sum()
-        for kdx in range(idx + self.min_dst, idx + self.max_dst + 1):
-            if kdx >= self.board.shape[0]:
-                break
-            weight += self.board[kdx, jdx]
-            self.add_edge(self.v_node(idx, jdx), self.h_node(kdx, jdx), weight=weight)
-
-    def add_north_edges(self, idx, jdx):
-        weight = self.board[max(0, idx - self.min_dst + 1) : idx, jdx].sum()
-        for kdx in range(idx - self.min_dst, idx - self.max_dst - 1, -1):
-            if kdx < 0:
-                break
-            weight += self.board[kdx, jdx]
-            self.add_edge(self.v_node(idx, jdx), self.h_node(kdx, jdx), weight=weight)
-
-    def get_shortest_path_weight(self):
-        path = nx.shortest_path(self, source="start", target="end", weight="weight")
-        return nx.path_weight(self, path, weight="weight")
-
-    @staticmethod
-    def h_node(idx, jdx):
-        return f"{idx} {jdx} H"
-
-    @staticmethod
-    def v_node(idx, jdx):
-        return f"{idx} {jdx} V"
+        self.height, self.width = board.shape
+        self._adjacency = None
+
+    def encode(self, row, col, orientation):
+        return (row * self.width + col) * 2 + orientation
+
+    def get_move_counts(self):
+        """
+        Number of moves out of each state, from the room left in each
+        direction.
+        """
+
+        def fits(room):
+            return np.clip(np.minimum(room, self.max_dst) - self.min_dst + 1, 0, None)
+
+        cols, rows = np.arange(self.width), np.arange(self.height)
+        counts = np.empty((self.height, self.width, 2), dtype=np.int64)
+        counts[:, :, H] = fits(self.width - 1 - cols) + fits(cols)
+        counts[:, :, V] = (fits(self.height - 1 - rows) + fits(rows))[:, None]
+        return counts.ravel()
+
+    def get_band_moves(self, start, stop):
+        """
+        Moves out of the states of board rows start to stop - 1 as padded
+        (row, col, orientation, slot) arrays of targets and weights, with -1
+        targets in the slots of moves that leave the board.  Each direction
+        and distance is one array operation over the band.
+        """
+        row_sums, col_sums = get_prefix_sums(self.board)
+        rows = np.arange(start, stop)[:, None]
+        cols = np.arange(self.width)
+        n_slots = 2 * (self.max_dst - self.min_dst + 1)
+        shape = (stop - start, self.width, 2, n_slots)
+        targets = np.full(shape, -1, dtype=np.int64)
+        weights = np.zeros(shape, dtype=np.int64)
+        band = row_sums[start:stop]
+        for slot, dst in enumerate(range(self.min_dst, self.max_dst + 1)):
+            # east and west from horizontal states, weights read along rows
+            east, west = cols + dst, cols - dst
+            ends = np.minimum(east, self.width - 1) + 1
+            targets[:, :, H, 2 * slot] = np.where(
+                east < self.width, self.encode(rows, east, V), -1
+            )
+            weights[:, :, H, 2 * slot] = band[:, ends] - band[:, cols + 1]
+            targets[:, :, H, 2 * slot + 1] = np.where(
+                west >= 0, self.encode(rows, west, V), -1
+            )
+            weights[:, :, H, 2 * slot + 1] = (
+                band[:, cols] - band[:, np.maximum(west, 0)]
+            )
+            # south and north from vertical states, weights read down columns
+            south, north = rows + dst, rows - dst
+            ends = np.minimum(south, self.height - 1) + 1
+            targets[:, :, V, 2 * slot] = np.where(
+                south < self.height, self.encode(south, cols, H), -1
+            )
+            weights[:, :, V, 2 * slot] = col_sums[ends, cols] - col_sums[rows + 1, cols]
+            targets[:, :, V, 2 * slot + 1] = np.where(
+                north >= 0, self.encode(north, cols, H), -1
+            )
+            weights[:, :, V, 2 * slot + 1] = (
+                col_sums[rows, cols] - col_sums[np.maximum(north, 0), cols]
+            )
+        return targets, weights
+
+    @instrument.timed()
+    def get_adjacency(self):
+        """
+        Every move in compressed sparse row form:  the moves out of state are
+        targets[offsets[state] : offsets[state + 1]], with their weights.
+        The tables are filled a band of rows at a time, so only one band of
+        padded moves exists at once, and kept as the smallest integer types
+        that fit.
+        """
+        if self._adjacency is None:
+            counts = self.get_move_counts()
+            n_moves = int(counts.sum())
+            index = np.int32 if n_moves < 2**31 else np.int64
+            offsets = np.zeros(len(counts) + 1, dtype=index)
+            np.cumsum(counts, out=offsets[1:])
+            targets = np.empty(n_moves, dtype=index)
+            max_weight = int(self.board.max()) * self.max_dst
+            weights = np.empty(n_moves, dtype=np.min_scalar_type(max_weight))
+
+            n_slots = 4 * (self.max_dst - self.min_dst + 1)
+            band_rows = max(1, BAND_MOVES // (self.width * n_slots))
+            for start in range(0, self.height, band_rows):
+                stop = min(start + band_rows, self.height)
+                band_targets, band_weights = self.get_band_moves(start, stop)
+                valid = band_targets >= 0
+                first = offsets[self.encode(start, 0, H)]
+                last = offsets[self.encode(stop, 0, H)]
+                targets[first:last] = band_targets[valid]
+                weights[first:last] = band_weights[valid]
+            instrument.count("graph edges", n_moves)
+            self._adjacency = offsets, targets, weights
+        return self._adjacency
+
+    @instrument.timed()
+    def get_heuristic(self):
+        """
+        Lower bound on the weight from each cell to the bottom right cell:  a
+        reverse Dijkstra over single steps between cells, ignoring the turn and
+        distance constraints.  Every crucible move is such a sequence of steps,
+        so the bound is admissible and consistent.
+        """
+        board = self.board.ravel().tolist()
+        end = self.height * self.width - 1
+        remaining = [math.inf] * len(board)
+        remaining[end] = 0
+        heap = [(0, end)]
+        while len(heap) > 0:
+            weight, cell = heapq.heappop(heap)
+            if weight > remaining[cell]:
+                continue
+            row, col = divmod(cell, self.width)
+            weight += board[cell]  # stepping from a neighbor enters cell
+            for d_row, d_col in OFFSETS:
+                n_row, n_col = row + d_row, col + d_col
+                if 0 <= n_row < self.height and 0 <= n_col < self.width:
+                    n_cell = n_row * self.width + n_col
+                    if weight < remaining[n_cell]:
+                        remaining[n_cell] = weight
+                        heapq.heappush(heap, (weight, n_cell))
+        return remaining
+
+    @instrument.timed()
+    def search(self, mode="astar"):
+        """
+        Shortest path from both orientations of the top left cell to either
+        orientation of the bottom right cell.  mode is "dijkstra", or "astar"
+        to order the heap by weight plus get_heuristic.
+        """
+        if mode not in MODES:
+            raise ValueError(f"unknown search mode {mode!r}")
+        heuristic = self.get_heuristic() if mode == "astar" else None
+        stats = SearchStats(mode)
+        offsets, targets, edge_weights = self.get_adjacency()
+        starts = [self.encode(0, 0, H), self.encode(0, 0, V)]
+        ends = {
+            self.encode(self.height - 1, self.width - 1, orientation)
+            for orientation in (H, V)
+        }
+        weights = [math.inf] * (2 * self.height * self.width)
+        heap = []
+        for start in starts:
+            weights[start] = 0
+            heap.append((0, 0, start))
+        stats.pushed = len(heap)
+
+        while len(heap) > 0:
+            _, weight, state = heapq.heappop(heap)
+            if weight > weights[state]:
+                continue  # already expanded with a lower weight
+            stats.expanded += 1
+            if state in ends:
+                stats.weight = weight
+                instrument.count(f"states expanded ({mode})", stats.expanded)
+                return stats
+            first, last = offsets[state], offsets[state + 1]
+            moves = zip(targets[first:last].tolist(), edge_weights[first:last].tolist())
+            for next_state, edge_weight in moves:
+                next_weight = weight + edge_weight
+                if next_weight < weights[next_state]:
+                    weights[next_state] = next_weight
+                    priority = next_weight
+                    if heuristic is not None:
+                        priority += heuristic[next_state // 2]
+                    heapq.heappush(heap, (priority, next_weight, next_state))
+                    stats.pushed += 1
+
+        raise ValueError("no path to the bottom right cell")
+
+    def get_shortest_path_weight(self, mode="astar"):
+        return self.search(mode).weight
 
     def __str__(self):
         return "\n".join("".join(str(col) for col in row) for row in self.board)
 
 
-def main(filename="input.txt"):
-    board = parse_board(read_file(filename))
-    print(f"part 1:  {CrucibleGraph(board).get_shortest_path_weight()}")
-    print(f"part 2:  {CrucibleGraph(board, 4, 10).get_shortest_path_weight()}")
+def compare_modes(graph):
+    """
+    Search graph in every mode, to check they agree and compare their work.
+    """
+    return [graph.search(mode) for mode in MODES]
+
+
+def main(filename="input.txt", compare=False):
+    board = parse_board(filename)
+    for number, graph in enumerate((CrucibleGraph(board), CrucibleGraph(board, 4, 10))):
+        print(f"part {number + 1}:  {graph.get_shortest_path_weight()}")
+        if compare:
+            for stats in compare_modes(graph):
+                print(f"    {stats}")
 
 
 if __name__ == "__main__":
     main("test.txt")
     main("test2.txt")
-    main()
+    main(compare=True)
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import bfs, grid
+from aoc.grid import DOT, HASH
+from aoc.inputs import read_lines
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+SPACE = ord(" ")
 
 
 def parse(lines):
@@ -48,33 +54,26 @@ def dig(instructions):
             coords[:, 0].max() - coords[:, 0].min() + 1,
             coords[:, 1].max() - coords[:, 1].min() + 1,
         ),
-        ".",
+        DOT,
+        dtype=np.uint8,
     )
-    board[coords[:, 0], coords[:, 1]] = "#"
+    board[coords[:, 0], coords[:, 1]] = HASH
     board = np.roll(board, -coords[:, 0].min(), axis=0)
     board = np.roll(board, -coords[:, 1].min(), axis=1)
 
-    board = np.pad(board, 1, constant_values=".")
+    board = grid.pad(board)
 
     board = fill(board)
-    return (board != " ").sum()
+    return (board != SPACE).sum()
 
 
 def fill(board):
-    queue = [(0, 0)]
-    while len(queue) > 0:
-        pos = queue.pop(0)
-        if board[pos] == ".":
-            board[pos] = " "
-            queue.append((pos[0] - 1, pos[1]))
-            queue.append((pos[0] + 1, pos[1]))
-            queue.append((pos[0], pos[1] - 1))
-            queue.append((pos[0], pos[1] + 1))
+    board[bfs.get_distances(board == DOT, [(0, 0)]) >= 0] = SPACE
     return board
 
 
 def main(filename="input.txt"):
-    print(dig(parse(read_file(filename))))
+    print(dig(parse(read_lines(filename))))
 
 
 if __name__ == "__main__":
@@ -2,12 +2,14 @@
 
 import re
 import itertools
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -228,7 +230,7 @@ def sort_coords(intervals):
 
 
 def main(filename="input.txt"):
-    print(dig(parse(read_file(filename))))
+    print(dig(parse(read_lines(filename))))
 
 
 if __name__ == "__main__":
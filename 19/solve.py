@@ -2,11 +2,12 @@
 
 import re
 from dataclasses import dataclass
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -129,7 +130,7 @@ def parse_part(line):
 
 
 def main(filename="input.txt"):
-    print(solve(*parse(read_file(filename))))
+    print(solve(*parse(read_lines(filename))))
 
 
 if __name__ == "__main__":
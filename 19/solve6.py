@@ -3,15 +3,17 @@
 import re
 from dataclasses import dataclass
 from copy import deepcopy
-import networkx as nx
-import numpy as np
 from copy import copy
 from itertools import permutations, combinations
+import sys
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -175,7 +177,7 @@ def parse_part(line):
 
 
 def main(filename="input.txt"):
-    print(solve(*parse(read_file(filename))))
+    print(solve(*parse(read_lines(filename))))
 
 
 if __name__ == "__main__":
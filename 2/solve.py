@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename="input.txt"):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse_games(lines):
@@ -60,8 +61,8 @@ def get_min_powers(games):
     return min_powers
 
 
-def main():
-    games = parse_games(read_file())
+def main(filename="input.txt"):
+    games = parse_games(read_lines(filename))
     valid_games = get_valid_games(games, {"red": 12, "green": 13, "blue": 14})
     min_powers = get_min_powers(games)
     print(f"part 1:  {sum(valid_games)}")
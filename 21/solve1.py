@@ -1,66 +1,41 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import bfs, grid
+from aoc.grid import DOT
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+START = ord("S")
 
 
-def parse(lines):
-    board = []
-    for line in lines:
-        board.append(list(line.strip()))
-    return np.array(board)
+def parse(filename):
+    return grid.load(filename)
 
 
 def get_reachable(distances, steps):
     """
-    Get the number of reachable squares.
+    Get the number of reachable squares.  steps may also be an array of step
+    counts, answered together from one histogram of the distances.
     """
-    if steps % 2 == 0:
-        return distances[
-            (distances >= 0) & (distances <= steps) & (distances % 2 == 0)
-        ].shape[0]
-
-    return distances[
-        (distances >= 0) & (distances <= steps) & ((distances + 1) % 2 == 0)
-    ].shape[0]
+    counts = bfs.get_reachable_counts(distances, steps)
+    return int(counts) if counts.ndim == 0 else counts
 
 
 def get_distances(board, start, start_val):
     """
     Get the distances from start_val to each square on the board.
     """
-    x, y = start
-    distances = np.full_like(board, -1, dtype=int)
-    distances[x, y] = start_val
-    bfs(board, distances, (x, y))
-    return distances
-
-
-def bfs(board, distances, start):
-    queue = [start]
-
-    while len(queue) > 0:
-        x, y = queue.pop(0)
-        distance = distances[x, y]
-
-        for x, y in [(x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)]:
-            if (
-                x in range(board.shape[1])
-                and y in range(board.shape[0])
-                and board[x, y] == "."
-                and distances[x, y] == -1
-            ):
-                distances[x, y] = distance + 1
-                queue.append((x, y))
+    return bfs.get_distances(board == DOT, [start], start_val)
 
 
 def solve(board, steps):
-    x, y = np.argwhere(board == "S")[0]
-    board[x, y] = "."
+    x, y = np.argwhere(board == START)[0]
+    board[x, y] = DOT
     distances = get_distances(board, (board.shape[0] // 2, board.shape[1] // 2), 0)
     return get_reachable(distances, steps)
 
@@ -73,7 +48,7 @@ def solve(board, steps):
 
 
 def main(filename, steps, expected=None):
-    result = solve(parse(read_file(filename)), steps)
+    result = solve(parse(filename), steps)
     print(result)
     if expected is not None:
         assert result == expected
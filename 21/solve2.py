@@ -1,21 +1,134 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc import bfs, grid
+from aoc.grid import DOT
+
+START = ord("S")
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+_TABLES = {}
 
 
-def parse(lines):
-    board = []
-    for line in lines:
-        board.append(list(line.strip()))
-    return np.array(board)
+def parse(filename):
+    return grid.load(filename)
 
 
 def solve(board, steps):
+    """
+    Use the closed form when the tile allows it, otherwise search the tiling.
+    """
+    x, y = np.argwhere(board == START)[0]
+    board[x, y] = DOT
+    if is_open(board, (x, y)):
+        return solve_closed_form(board, steps)
+    return solve_tiled(board, steps)
+
+
+def is_open(board, start):
+    """
+    The closed form needs a square tile of odd size with the start in the
+    middle, and a clear border, middle row and middle column.  Shortest paths
+    into a far tile then enter it at an edge midpoint or a corner.
+    """
+    size, width = board.shape
+    half = size // 2
+    clear = board == DOT
+    return (
+        size == width
+        and size % 2 == 1
+        and tuple(start) == (half, half)
+        and clear[[0, half, -1]].all()
+        and clear[:, [0, half, -1]].all()
+    )
+
+
+def solve_closed_form(board, steps):
+    """
+    Count the reachable squares tile by tile using only the distance tables
+    of a single tile.
+
+    A tile in direction (drow, dcol) is entered at the edge midpoint or
+    corner facing the start.  The k-th tile along an axis is entered after
+    half + 1 + (k - 1) * size steps.  The tiles with (a - 1) + (b - 1) == k
+    in a diagonal quadrant are entered after 2 * (half + 1) + k * size steps
+    and there are k + 1 of them.
+    """
+    size = board.shape[0]
+    half = size // 2
+    tables = get_entry_tables(board)
+    total = int(bfs.count_reachable(tables[0, 0], steps))
+    for direction, table in tables.items():
+        if direction == (0, 0):
+            continue
+        if 0 in direction:
+            total += sum_tiles(table, steps - half - 1, size, weighted=False)
+        else:
+            total += sum_tiles(table, steps - 2 * (half + 1), size, weighted=True)
+    return total
+
+
+def get_entry_tables(board):
+    """
+    Distances within one tile from the 9 points a walk enters it through,
+    keyed by direction of travel:  the center for (0, 0), the edge midpoints
+    for the axes and the corners for the diagonals.  Each table holds the
+    step counts from bfs.get_step_counts.  Cached by board contents.
+    """
+    key = board.tobytes()
+    if key not in _TABLES:
+        last = board.shape[0] - 1
+        half = last // 2
+        entries = {0: half, 1: 0, -1: last}
+        passable = board == DOT
+        _TABLES.clear()  # one board at a time
+        _TABLES[key] = {}
+        for drow in (-1, 0, 1):
+            for dcol in (-1, 0, 1):
+                start = (entries[drow], entries[dcol])
+                distances = bfs.get_distances(passable, [start])
+                _TABLES[key][drow, dcol] = bfs.get_step_counts(distances)
+    return _TABLES[key]
+
+
+def sum_tiles(table, budget, size, weighted):
+    """
+    Sum bfs.count_reachable over tiles k = 0, 1, ... entered with budget
+    budget - k * size, each counted k + 1 times if weighted.
+
+    Tiles with budget at least the largest distance are full, and since size
+    is odd the parity of their budget alternates with k.  Full tiles are
+    summed in closed form and the few partial ones counted directly.
+    """
+    if budget < 0:
+        return 0
+    max_distance = len(table) - 1
+    # full tile counts by parity of the budget
+    full = bfs.count_reachable(table, max_distance + (np.arange(2) - max_distance) % 2)
+    n_tiles = budget // size + 1
+    n_full = 0
+    if budget >= max_distance:
+        n_full = min(n_tiles, (budget - max_distance) // size + 1)
+
+    total = 0
+    for parity in (0, 1):  # of k
+        n_parity = (n_full - parity + 1) // 2
+        if weighted:
+            n_parity = n_parity**2 if parity == 0 else n_parity * (n_parity + 1)
+        total += int(full[(budget + parity) % 2]) * n_parity
+
+    partial = np.arange(n_full, n_tiles)
+    weights = partial + 1 if weighted else 1
+    total += int((weights * bfs.count_reachable(table, budget - partial * size)).sum())
+    return total
+
+
+def solve_tiled(board, steps):
     """
     Eventually the patterns stabilize into left/right/up/down and 4 corners,
     both in terms of number of reachable and number of steps to reach a given
@@ -55,13 +168,11 @@ def solve(board, steps):
     Also needed are the up/down/left/right sections.
     """
 
-    x, y = np.argwhere(board == "S")[0]
-    board[x, y] = "."
     n_repeat = 13
     center = n_repeat // 2
     step = board.shape[0]
-    board = np.tile(board, (n_repeat, n_repeat)).copy()
-    distances = get_distances(board, (board.shape[0] // 2, board.shape[1] // 2), 0)
+    start = (n_repeat * board.shape[0] // 2, n_repeat * board.shape[1] // 2)
+    distances = bfs.get_frontier_distances(board == DOT, [start], 0, n_repeat)
 
     # divide into equal-sized chunks
     chunks = get_chunks(distances, distances.shape[0] // n_repeat)
@@ -105,17 +216,19 @@ def get_corner_area(queue, y):
 
 def get_reachable_chunks(chunks, steps):
     """
-    Get the number of reachable squares for each chunk as a 2-d array.
+    Get the number of reachable squares for each chunk as a 2-d array.  Each
+    chunk's distances are shifted down by its nearest square first, so its
+    bfs.get_step_counts histogram spans the chunk rather than the whole walk.
     """
-    reachable_chunks = []
-
-    for y in range(chunks.shape[1]):
-        row = []
-        for x in range(chunks.shape[0]):
-            row.append(get_reachable(chunks[x, y], steps))
-        reachable_chunks.append(row)
-
-    return np.array(reachable_chunks)
+    counts = np.zeros(chunks.shape[:2], dtype=int)
+    for idx in np.ndindex(*chunks.shape[:2]):
+        reached = chunks[idx] >= 0
+        if not reached.any():
+            continue
+        nearest = chunks[idx][reached].min()
+        shifted = np.where(reached, chunks[idx] - nearest, -1)
+        counts[idx] = bfs.get_reachable_counts(shifted, steps - nearest)
+    return counts.T
 
 
 def get_end_chunk(chunk, delta, steps):
@@ -192,51 +305,8 @@ def normalize(chunk):
     return chunk
 
 
-def get_reachable(distances, steps):
-    """
-    Get the number of reachable squares.
-    """
-    if steps % 2 == 0:
-        return distances[
-            (distances >= 0) & (distances <= steps) & (distances % 2 == 0)
-        ].shape[0]
-
-    return distances[
-        (distances >= 0) & (distances <= steps) & ((distances + 1) % 2 == 0)
-    ].shape[0]
-
-
-def get_distances(board, start, start_val):
-    """
-    Get the distances from start_val to each square on the board.
-    """
-    x, y = start
-    distances = np.full_like(board, -1, dtype=int)
-    distances[x, y] = start_val
-    bfs(board, distances, (x, y))
-    return distances
-
-
-def bfs(board, distances, start):
-    queue = [start]
-
-    while len(queue) > 0:
-        x, y = queue.pop(0)
-        distance = distances[x, y]
-
-        for x, y in [(x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)]:
-            if (
-                x in range(board.shape[1])
-                and y in range(board.shape[0])
-                and board[x, y] == "."
-                and distances[x, y] == -1
-            ):
-                distances[x, y] = distance + 1
-                queue.append((x, y))
-
-
 def main(filename, steps, expected=None):
-    result = solve(parse(read_file(filename)), steps)
+    result = solve(parse(filename), steps)
     print(result)
     if expected is not None:
         assert result == expected
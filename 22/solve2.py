@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import numpy as np
 import networkx as nx
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -97,7 +99,7 @@ def main(filename, expected=None):
     """
     Solve and check expected value if provided.
     """
-    result = solve(parse(read_file(filename)))
+    result = solve(parse(read_lines(filename)))
     print(result)
     if expected is not None:
         assert result == expected
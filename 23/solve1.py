@@ -1,25 +1,25 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc import grid
+from aoc.grid import DOT, HASH
 
 
-def parse(lines):
-    board = []
-    for line in lines:
-        board.append(list(line.strip()))
-    return np.array(board)
+def parse(filename):
+    return grid.load(filename)
 
 
 def solve(board):
-    board = np.pad(board, 1, constant_values="#")
-    start = 1, np.argwhere(board[1] == ".")[0, 0]
-    end = board.shape[0] - 2, np.argwhere(board[-2] == ".")[0, 0]
+    board = grid.pad(board, 1, HASH)
+    start = 1, np.argwhere(board[1] == DOT)[0, 0]
+    end = board.shape[0] - 2, np.argwhere(board[-2] == DOT)[0, 0]
 
     segments = []
     dfs(board, start, end, segments)
@@ -34,7 +34,7 @@ def follow_trail(board, start):
     next_coords = get_adjacent(board, start)
     while len(next_coords) == 1:
         start = next_coords.pop()
-        board[start] = "#"
+        board[start] = HASH
         distance += 1
         next_coords = get_adjacent(board, start)
     return start, distance
@@ -63,20 +63,20 @@ def get_adjacent(board, coord):
     """
     next_coords = []
     for (dx, dy), direction in [
-        ((0, 1), ">"),
-        ((0, -1), "<"),
-        ((1, 0), "v"),
-        ((-1, 0), "^"),
+        ((0, 1), ord(">")),
+        ((0, -1), ord("<")),
+        ((1, 0), ord("v")),
+        ((-1, 0), ord("^")),
     ]:
         x, y = coord
         next_coord = x + dx, y + dy
-        if board[next_coord] == "." or board[next_coord] == direction:
+        if board[next_coord] == DOT or board[next_coord] == direction:
             next_coords.append(next_coord)
     return next_coords
 
 
 def main(filename, expected):
-    result = solve(parse(read_file(filename)))
+    result = solve(parse(filename))
     print(result)
     if expected is not None:
         assert result == expected
@@ -1,24 +1,24 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import numpy as np
 import networkx as nx
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc import bfs, grid, instrument
+from aoc.grid import DOT, HASH
 
 
-def parse(lines):
+def parse(filename):
     """
     Parese board, replace slopes with level ground.
     """
-    board = []
-    for line in lines:
-        board.append(list(line.strip()))
-    board = np.pad(board, 1, constant_values="#")
-    board[np.nonzero(np.isin(board, ("^", "v", "<", ">")))] = "."
+    board = grid.load(filename, 1, HASH)
+    board[np.nonzero(np.isin(board, grid.codes("^v<>")))] = DOT
     return board
 
 
@@ -26,12 +26,13 @@ def solve(board):
     """
     Build the graph and find max path length.
     """
-    start = 1, np.argwhere(board[1] == ".")[0, 0]
-    end = board.shape[0] - 2, np.argwhere(board[-2] == ".")[0, 0]
+    start = 1, np.argwhere(board[1] == DOT)[0, 0]
+    end = board.shape[0] - 2, np.argwhere(board[-2] == DOT)[0, 0]
     graph = build_graph(board, start)
     return get_max_path_length(graph, start, end)
 
 
+@instrument.timed()
 def build_graph(board, start):
     """
     Find intersections and path length between.
@@ -40,17 +41,21 @@ def build_graph(board, start):
     return nx.Graph(get_edges(board, nodes))
 
 
+@instrument.timed()
 def get_max_path_length(graph, start, end):
     """
     Enumerate all paths and find maximal length.
     """
     max_path_length = 0
+    n_paths = 0
 
     for path in nx.all_simple_paths(graph, start, end):
+        n_paths += 1
         length = nx.path_weight(graph, path, "weight")
         if length > max_path_length:
             max_path_length = length
 
+    instrument.count("paths enumerated", n_paths)
     return max_path_length
 
 
@@ -58,16 +63,9 @@ def get_adjacent(board, coord):
     """
     Get the next candidate coordinates, filter "#" squares.
     """
-    x, y = coord
     adjacent = []
-    for dx, dy in [
-        (0, 1),
-        (0, -1),
-        (1, 0),
-        (-1, 0),
-    ]:
-        next_coord = x + dx, y + dy
-        if board[next_coord] in (".", "O"):
+    for next_coord in grid.neighbors(board, coord):
+        if board[next_coord] == DOT:
             adjacent.append(next_coord)
     return adjacent
 
@@ -86,7 +84,7 @@ def get_node_edges(board, node):
     """
     Find all edges from this node/intersection to adjacent nodes.
     """
-    board[node] = "#"
+    board[node] = HASH
     edges = []
 
     for next_coord in get_adjacent(board, node):
@@ -101,22 +99,10 @@ def get_intersections(board, start):
     """
     Find the coordinates of all intersections.
     """
-    intersections = []
-    queue = [start]
-
-    while len(queue) > 0:
-        start = queue.pop(0)
-        if board[start] == "O":
-            continue
-
-        board[start] = "O"
-        next_coords = get_adjacent(board, start)
-        queue.extend(next_coords)
-
-        if len(next_coords) > 2:
-            intersections.append(start)
-
-    return intersections
+    passable = board != HASH
+    reached = bfs.get_distances(passable, [start]) >= 0
+    intersections = reached & (grid.count_neighbors(passable) > 2)
+    return list(map(tuple, np.argwhere(intersections).tolist()))
 
 
 def follow_trail(board, start):
@@ -129,7 +115,7 @@ def follow_trail(board, start):
 
     while len(next_coords) == 1:
         start = next_coords.pop(0)
-        board[start] = "#"
+        board[start] = HASH
         next_coords.extend(get_adjacent(board, start))
         step += 1
 
@@ -137,7 +123,7 @@ def follow_trail(board, start):
 
 
 def main(filename, expected=None):
-    result = solve(parse(read_file(filename)))
+    result = solve(parse(filename))
     print(result)
     if expected is not None:
         assert result == expected
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 from z3 import *
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -93,7 +95,7 @@ def get_future(ball, t):
 
 
 def main(filename="input.txt", min_val=7, max_val=27):
-    print(solve(parse(read_file(filename)), min_val, max_val))
+    print(solve(parse(read_lines(filename)), min_val, max_val))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import networkx as nx
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse(lines):
@@ -44,7 +46,7 @@ def solve(graph):
 
 
 def main(filename="input.txt"):
-    print(f"part 1:  {solve(parse(read_file(filename)))}")
+    print(f"part 1:  {solve(parse(read_lines(filename)))}")
 
 
 if __name__ == "__main__":
@@ -2,16 +2,16 @@
 
 
 import re
-import numpy as np
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename="input.txt"):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc import grid
 
 
-def clean_lines(lines):
-    return [list(line.strip()) for line in lines]
+def parse_array(filename):
+    return grid.load(filename, 1)
 
 
 def apply_row_slice_callback(array, callback):
@@ -24,7 +24,7 @@ def apply_row_slice_callback(array, callback):
 
 def get_part_numbers(row_slice):
     part_numbers = []
-    for match in re.finditer(r"\d+", "".join(row_slice[1])):
+    for match in re.finditer(rb"\d+", row_slice[1].tobytes()):
         idx, jdx = match.span()
         if is_part_number(row_slice[:, idx - 1 : jdx + 1]):
             part_numbers.append(int(match.group()))
@@ -32,13 +32,12 @@ def get_part_numbers(row_slice):
 
 
 def is_part_number(col_slice):
-    flat_text = "".join(col_slice.flatten())
-    return len(re.findall(r"[^\d.]", flat_text)) > 0
+    return len(re.findall(rb"[^\d.]", col_slice.tobytes())) > 0
 
 
 def get_gear_ratios(row_slice):
     gear_ratios = []
-    for match in re.finditer(r"\*", "".join(row_slice[1])):
+    for match in re.finditer(rb"\*", row_slice[1].tobytes()):
         gear_ratios += get_gear_ratio(row_slice, match.span()[0])
     return gear_ratios
 
@@ -46,7 +45,7 @@ def get_gear_ratios(row_slice):
 def get_gear_ratio(row_slice, idx):
     numbers = []
     for jdx in range(3):
-        numbers += list(re.finditer(r"\d+", "".join(row_slice[jdx])))
+        numbers += list(re.finditer(rb"\d+", row_slice[jdx].tobytes()))
     gear_values = get_adjacent_numbers(numbers, idx)
     return [gear_values[0] * gear_values[1]] if len(gear_values) == 2 else []
 
@@ -60,10 +59,8 @@ def get_adjacent_numbers(numbers, idx):
     return adjacent_numbers
 
 
-def main():
-    lines = read_file()
-    lines = clean_lines(lines)
-    array = np.pad(lines, 1, "constant", constant_values=".")
+def main(filename="input.txt"):
+    array = parse_array(filename)
     part_numbers = apply_row_slice_callback(array, get_part_numbers)
     gear_ratios = apply_row_slice_callback(array, get_gear_ratios)
     print(f"part 1:  {sum(part_numbers)}")
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse_cards(lines):
@@ -41,7 +42,7 @@ def get_card_counts(matches):
 
 
 def main(filename="input.txt"):
-    cards = parse_cards(read_file(filename))
+    cards = parse_cards(read_lines(filename))
     matches = get_matches(cards)
     print(f"part 1:  {sum(get_values(matches))}")
     print(f"part 2:  {sum(get_card_counts(matches))}")
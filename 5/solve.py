@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import read_lines
 
 
 class Mapper:
@@ -33,11 +39,6 @@ class MapRange:
             raise ValueError
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def parse_lines(lines):
     lines.append('\n')
     return parse_seeds(lines), parse_maps(lines)
@@ -80,7 +81,7 @@ def map_seeds(mappers, seeds):
 
 
 def main(filename="input.txt"):
-    seeds, maps = parse_lines(read_file(filename))
+    seeds, maps = parse_lines(read_lines(filename))
     locations = map_seeds(maps, seeds)
     print(f"part 1:  {min(locations)}")
 
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import networkx as nx
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import read_lines
+
 
 class Mapper:
 
@@ -47,11 +54,6 @@ class MapRange:
             raise ValueError
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def parse_lines(lines):
     lines.append('\n')
     return parse_seeds(lines), parse_maps(lines)
@@ -121,7 +123,7 @@ def solve2(mappers, seed_ranges):
 
 
 def main(filename="input.txt"):
-    seed_ranges, mappers = parse_lines(read_file(filename))
+    seed_ranges, mappers = parse_lines(read_lines(filename))
     print(f"part 2:  {min(solve2(mappers, seed_ranges))}")
 
 
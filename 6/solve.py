@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse_races(lines):
@@ -38,8 +40,8 @@ def get_win_count(race):
 
 
 def main(filename="input.txt"):
-    win_counts = get_win_counts(parse_races(read_file(filename)))
-    win_count = get_win_count(parse_race(read_file(filename)))
+    win_counts = get_win_counts(parse_races(read_lines(filename)))
+    win_count = get_win_count(parse_race(read_lines(filename)))
     print(f"part 1:  {np.prod(win_counts)}")
     print(f"part 2:  {win_count}")
 
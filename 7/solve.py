@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import read_lines
+
 
 class Hand:
     card_map = {
@@ -101,11 +108,6 @@ class HandVariant(Hand):
         return strength
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def parse_hands(lines, hand_type):
     hands = []
     for line in lines:
@@ -122,7 +124,7 @@ def get_winnings(hands):
 
 
 def main(filename="input.txt"):
-    lines = read_file(filename)
+    lines = read_lines(filename)
     print(f"part 1:  {sum(get_winnings(parse_hands(lines, Hand)))}")
     print(f"part 2:  {sum(get_winnings(parse_hands(lines, HandVariant)))}")
 
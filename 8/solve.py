@@ -2,6 +2,12 @@
 
 import re
 from math import lcm
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import read_lines
 
 
 class Node:
@@ -50,11 +56,6 @@ class GhostPath:
         return node.left if self._get_direction() == "L" else node.right
 
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
-
-
 def parse_directions(lines):
     directions = list(lines.pop(0).strip())
     lines.pop(0)
@@ -92,7 +93,7 @@ def follow_ghost_directions(directions, starts):
 
 
 def main(filename="input.txt"):
-    lines = read_file(filename)
+    lines = read_lines(filename)
     directions = parse_directions(lines)
     nodes = parse_graph(lines)
     print(f"part 1:  {follow_directions(directions, nodes['AAA'])}")
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+from aoc.inputs import read_lines
 
 
 def parse_histories(lines):
@@ -29,7 +31,7 @@ def extrapolate_backward(diff):
 
 
 def main(filename="input.txt"):
-    histories = parse_histories(read_file(filename))
+    histories = parse_histories(read_lines(filename))
     print(f"part 1:  {sum(get_extrapolations(histories, extrapolate_forward))}")
     print(f"part 2:  {sum(get_extrapolations(histories, extrapolate_backward))}")
 
@@ -0,0 +1,3 @@
+"""
+Shared tooling for running the day solvers in a single process.
+"""
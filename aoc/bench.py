@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark the day solvers against stored baselines.
+
+Parse and solve phases are timed separately over repeated runs and the best
+time of each is compared to the baseline file.  A phase regresses when it is
+slower than threshold * baseline.  Phases faster than --floor seconds are
+too noisy to judge and are never flagged.  Answers are recorded alongside the
+timings so a change in result is also reported.
+
+    python -m aoc.bench --save       # record baselines
+    python -m aoc.bench 12 17        # compare, exit 1 on regression
+
+With --sweep the baselines are skipped and each part is run on generated
+inputs of increasing size instead.  The exponent k of the fitted n**k curve
+between consecutive sizes is printed to expose quadratic and worse growth.
+
+    python -m aoc.bench 17 --sweep 20 40 80 160
+"""
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+from pathlib import Path
+
+from aoc.days import ROOT, get_parts
+from aoc.generate import generate
+from aoc.runner import run_part
+
+BASELINE = ROOT / "bench_baseline.json"
+
+
+def get_key(part):
+    return f"{part.day}.{part.part}"
+
+
+def bench_part(part, filename="input.txt", repeat=5):
+    """
+    Run a part repeatedly, return the answer and the best time of each phase.
+    """
+    results = [run_part(part, filename) for _ in range(repeat)]
+    return {
+        "answer": results[0].answer,
+        "parse": min(result.parse_seconds for result in results),
+        "solve": min(result.solve_seconds for result in results),
+    }
+
+
+def load_baseline(path):
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f_in:
+        return json.load(f_in)
+
+
+def save_baseline(path, timings):
+    with open(path, "w", encoding="utf-8") as f_out:
+        json.dump(timings, f_out, indent=2, sort_keys=True, default=int)
+        f_out.write("\n")
+
+
+def get_regressions(timing, baseline, threshold, floor, expected=None):
+    """
+    Return a description of each way timing is worse than baseline.
+    """
+    regressions = []
+    if expected is not None and timing["answer"] != expected:
+        regressions.append(f"answer {timing['answer']} != expected {expected}")
+    if baseline.get("answer", timing["answer"]) != timing["answer"]:
+        regressions.append(f"answer {timing['answer']} != {baseline['answer']}")
+    for phase in ("parse", "solve"):
+        if phase not in baseline or timing[phase] < floor:
+            continue
+        ratio = timing[phase] / max(baseline[phase], 1e-9)
+        if ratio > threshold:
+            regressions.append(f"{phase} {ratio:.2f}x baseline")
+    return regressions
+
+
+def format_timing(part, timing, baseline):
+    line = f"{part}:  parse {timing['parse']:.4f}s  solve {timing['solve']:.4f}s"
+    if "solve" in baseline:
+        line += f"  (baseline {baseline['parse']:.4f}s / {baseline['solve']:.4f}s)"
+    return line
+
+
+def bench(parts, baselines, filename="input.txt", repeat=5, threshold=1.25, floor=0.01):
+    """
+    Benchmark parts, print a line per part and return (timings, regressions).
+    """
+    timings = {}
+    regressions = {}
+    for part in parts:
+        key = get_key(part)
+        timings[key] = bench_part(part, filename, repeat)
+        baseline = baselines.get(key, {})
+        print(format_timing(part, timings[key], baseline))
+        expected = part.expected if filename == "input.txt" else None
+        found = get_regressions(timings[key], baseline, threshold, floor, expected)
+        if len(found) > 0:
+            regressions[key] = found
+            print(f"  REGRESSION:  {', '.join(found)}")
+    return timings, regressions
+
+
+def get_exponent(size_0, seconds_0, size_1, seconds_1):
+    """
+    Slope of the log-log curve between two measurements.
+    """
+    if min(seconds_0, seconds_1) <= 0:
+        return math.nan
+    return math.log(seconds_1 / seconds_0) / math.log(size_1 / size_0)
+
+
+def sweep(parts, sizes, seed=0, repeat=1):
+    """
+    Time each part on generated inputs of each size.  Return the
+    {key: [(size, parse, solve), ...]} curves.
+    """
+    curves = {get_key(part): [] for part in parts}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for part in parts:
+            print(f"{part}:")
+            curve = curves[get_key(part)]
+            for idx, size in enumerate(sizes):
+                path = Path(tmp_dir) / f"{part.day}_{size}_{seed}.txt"
+                if not path.exists():
+                    path.write_text(generate(part.day, size, seed), encoding="utf-8")
+                if idx == 0:
+                    run_part(part, str(path))  # warm up lazy imports and caches
+                timing = bench_part(part, str(path), repeat)
+                curve.append((size, timing["parse"], timing["solve"]))
+                line = (
+                    f"  size {size:>7}:  parse {timing['parse']:.4f}s"
+                    f"  solve {timing['solve']:.4f}s"
+                )
+                if len(curve) > 1:
+                    total_0 = sum(curve[-2][1:])
+                    total_1 = sum(curve[-1][1:])
+                    exponent = get_exponent(curve[-2][0], total_0, size, total_1)
+                    line += f"  ~n^{exponent:.2f}"
+                print(line)
+    return curves
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("days", nargs="*", type=int, help="days to run, default all")
+    parser.add_argument("--parts", nargs="+", type=int, choices=(1, 2))
+    parser.add_argument("--input", default="input.txt", help="file in each day dir")
+    parser.add_argument("--repeat", type=int, help="default 5, or 1 with --sweep")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--floor", type=float, default=0.01)
+    parser.add_argument("--baseline", type=lambda path: ROOT / path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="update the baseline")
+    parser.add_argument("--sweep", nargs="+", type=int, help="generated input sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    parts = get_parts(args.days or None, args.parts)
+    if args.sweep is not None:
+        sweep(parts, sorted(args.sweep), args.seed, args.repeat or 1)
+        return 0
+    baselines = load_baseline(args.baseline)
+    timings, regressions = bench(
+        parts, baselines, args.input, args.repeat or 5, args.threshold, args.floor
+    )
+    if args.save:
+        save_baseline(args.baseline, {**baselines, **timings})
+        print(f"saved:  {args.baseline}")
+        return 0
+    if len(regressions) > 0:
+        print(f"regressed:  {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
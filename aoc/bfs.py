@@ -0,0 +1,140 @@
+"""
+Breadth first search over grid cells.
+
+get_distances addresses cells by flat integer index into the grid padded
+with one impassable cell on each side, so neighbors are idx +- 1 and idx +- width
+without bounds checks.  Each cell is queued at most once, so the queue is a
+preallocated list read through a head index instead of a list popped from the
+front.
+
+Which cells can be entered is given by a boolean passable mask.  moves
+optionally restricts the steps out of each cell further:  moves[k] is a mask
+of the cells that may step in the direction of grid.OFFSETS[k], for grids
+such as pipes where connectivity depends on both ends.
+
+get_frontier_distances gives the same result with the per-cell work done in
+array operations, and can search a tiled grid without building it.
+"""
+
+import numpy as np
+
+from aoc import instrument
+from aoc.grid import OFFSETS
+
+
+@instrument.timed("bfs")
+def get_distances(passable, starts, start_distance=0, moves=None):
+    """
+    Distance from the nearest start to each cell, -1 where unreachable.
+    """
+    height, width = passable.shape
+    width += 2
+    deltas = (1, -1, width, -width)  # same order as grid.OFFSETS
+    enterable = np.pad(passable, 1, constant_values=False).ravel().tolist()
+    exits = None
+    if moves is not None:
+        exits = [
+            np.pad(move, 1, constant_values=False).ravel().tolist() for move in moves
+        ]
+
+    distances = [-1] * len(enterable)
+    queue = [0] * len(enterable)
+    tail = 0
+    for row, col in starts:
+        idx = (row + 1) * width + col + 1
+        if distances[idx] < 0:
+            distances[idx] = start_distance
+            queue[tail] = idx
+            tail += 1
+
+    head = 0
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        distance = distances[idx] + 1
+        for k, delta in enumerate(deltas):
+            next_idx = idx + delta
+            if (
+                distances[next_idx] < 0
+                and enterable[next_idx]
+                and (exits is None or exits[k][idx])
+            ):
+                distances[next_idx] = distance
+                queue[tail] = next_idx
+                tail += 1
+
+    instrument.count("bfs nodes expanded", tail)
+    return np.array(distances).reshape(height + 2, width)[1:-1, 1:-1]
+
+
+@instrument.timed("frontier bfs")
+def get_frontier_distances(passable, starts, start_distance=0, repeat=1):
+    """
+    Same distances as get_distances, but each step expands the whole frontier
+    with array operations, so the Python overhead is per step, not per cell.
+
+    With repeat > 1 the search covers passable tiled repeat times in each
+    direction.  Passability is looked up modulo the tile size, so the tiled
+    mask is never built.
+    """
+    tile_height, tile_width = passable.shape
+    height, width = tile_height * repeat, tile_width * repeat
+    d_rows, d_cols = np.array(OFFSETS).T
+    distances = np.full((height, width), -1, dtype=int)
+    rows, cols = np.array(starts, dtype=int).reshape(-1, 2).T
+    distances[rows, cols] = start_distance
+    distance = start_distance
+    expanded = len(rows)
+
+    while len(rows) > 0:
+        distance += 1
+        rows = (rows[:, None] + d_rows).ravel()
+        cols = (cols[:, None] + d_cols).ravel()
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        rows, cols = rows[inside], cols[inside]
+        enter = passable[rows % tile_height, cols % tile_width]
+        enter &= distances[rows, cols] < 0
+        rows, cols = rows[enter], cols[enter]
+        # a cell reached from several frontier cells is kept once:  the
+        # last write of each cell's candidate index wins
+        order = np.arange(len(rows))
+        distances[rows, cols] = order
+        kept = distances[rows, cols] == order
+        rows, cols = rows[kept], cols[kept]
+        distances[rows, cols] = distance
+        expanded += len(rows)
+
+    instrument.count("bfs nodes expanded", expanded)
+    return distances
+
+
+def get_step_counts(distances):
+    """
+    Cumulative histogram of distances split by parity:  counts[d] is the
+    number of cells at distance at most d with the same parity as d.  These
+    are the cells a walk of exactly d steps can end on, since it can waste
+    steps in pairs by stepping back and forth.
+    """
+    counts = np.bincount(distances[distances >= 0].ravel(), minlength=2)
+    counts[0::2] = np.cumsum(counts[0::2])
+    counts[1::2] = np.cumsum(counts[1::2])
+    return counts
+
+
+def count_reachable(step_counts, steps):
+    """
+    Look up get_step_counts for a scalar or array of step counts at once.
+    Beyond the largest distance the last count of the same parity holds.
+    """
+    steps = np.asarray(steps)
+    last = len(step_counts) - 1
+    tops = np.array((last - last % 2, last - (last + 1) % 2))  # by parity
+    idx = np.where(steps <= last, steps, tops[steps % 2])
+    return np.where(steps < 0, 0, step_counts[np.maximum(idx, 0)])
+
+
+def get_reachable_counts(distances, steps):
+    """
+    Number of cells a walk of exactly each of steps can end on.
+    """
+    return count_reachable(get_step_counts(distances), steps)
@@ -0,0 +1,103 @@
+"""
+On-disk cache of part answers.
+
+Entries are keyed by a hash of the input file, the solver script, the aoc
+modules the script uses and the registry callbacks for the part.  The
+callbacks carry the parameters, such as the step count for day 21 or the
+crucible distances for day 17, so changing any of these misses the cache.
+
+Each entry is a small JSON file.  Reading an entry marks it as recently used
+and the least recently used entries are evicted once there are more than
+max_entries.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from aoc.days import ROOT
+
+CACHE_DIR = ROOT / ".cache" / "results"
+
+
+def get_mtime(path):
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:  # evicted by another process
+        return 0
+
+
+@dataclass
+class ResultCache:
+    path: Path = CACHE_DIR
+    max_entries: int = 256
+
+    def get(self, key):
+        entry = self.path / f"{key}.json"
+        try:
+            with open(entry, encoding="utf-8") as f_in:
+                data = json.load(f_in)
+            os.utime(entry)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return data
+
+    def put(self, key, data):
+        """
+        Write an entry atomically, so parallel workers never read a partial one.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry = self.path / f"{key}.json"
+        tmp = self.path / f"{key}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f_out:
+            json.dump(data, f_out, default=int)
+        os.replace(tmp, entry)
+        self.evict()
+
+    def evict(self):
+        entries = sorted(self.path.glob("*.json"), key=get_mtime)
+        for entry in entries[: max(0, len(entries) - self.max_entries)]:
+            entry.unlink(missing_ok=True)
+
+
+def get_dependencies(module):
+    """
+    Source files of the aoc modules a solver uses, directly or through other
+    aoc modules.
+    """
+    files = set()
+    stack = [module]
+    while len(stack) > 0:
+        for value in vars(stack.pop()).values():
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or not name.startswith("aoc."):
+                continue
+            dependency = sys.modules[name]
+            if dependency.__file__ not in files:
+                files.add(dependency.__file__)
+                stack.append(dependency)
+    return sorted(files)
+
+
+def get_source(callback):
+    try:
+        return inspect.getsource(callback)
+    except (OSError, TypeError):
+        return repr(callback.__code__.co_code)
+
+
+def get_key(part, module, input_path):
+    digest = hashlib.sha256(f"{part.day} {part.part}".encode("utf-8"))
+    for path in [input_path, part.path, *get_dependencies(module)]:
+        digest.update(Path(path).read_bytes())
+    for callback in (part.parse, part.solve):
+        digest.update(get_source(callback).encode("utf-8"))
+    return digest.hexdigest()
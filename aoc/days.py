@@ -0,0 +1,362 @@
+"""
+Registry of the day solvers.
+
+Each part names the script implementing it, a parse callback taking
+(module, filename) and a solve callback taking (module, data).  Parts are
+parsed independently so they never share mutable state, which lets the runner
+execute them in any order or in separate processes.
+
+cost is a rough single-core runtime on input.txt in seconds.  It is only used
+to start the longest parts first when running in parallel.
+
+Omitted scripts:
+- 5/solve3.py and 18/solve11.py are scratch work ending in breakpoint()
+- day 20 has no solver
+"""
+
+from dataclasses import dataclass
+from math import lcm
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Part:
+    day: int
+    part: int
+    script: str
+    parse: object
+    solve: object
+    expected: object = None
+    cost: float = 0
+
+    @property
+    def path(self):
+        return ROOT / str(self.day) / self.script
+
+    def get_input(self, filename="input.txt"):
+        return ROOT / str(self.day) / filename
+
+    def __str__(self):
+        return f"day {self.day} part {self.part}"
+
+
+def parse_day_8(module, filename):
+    lines = module.read_lines(filename)
+    directions = module.parse_directions(lines)
+    return directions, module.parse_graph(lines)
+
+
+def solve_day_12_unfolded(module, groups):
+    module.unfold_groups(groups)
+    return sum(module.get_counts(groups))
+
+
+def solve_day_16_corner(module, board):
+    board.trace(0, 0, module.EAST)
+    return int(board.get_energized())
+
+
+def read(module, filename):
+    return module.read_lines(filename)
+
+
+def parse(module, filename):
+    return module.parse(module.read_lines(filename))
+
+
+def parse_grid(module, filename):
+    return module.parse(filename)
+
+
+PARTS = [
+    Part(1, 1, "solve.py", read, lambda m, lines: m.sum_lines(lines)),
+    Part(1, 2, "solve.py", read, lambda m, lines: m.sum_lines(m.replace_words(lines))),
+    Part(
+        2,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_games(m.read_lines(f)),
+        lambda m, games: sum(
+            m.get_valid_games(games, {"red": 12, "green": 13, "blue": 14})
+        ),
+    ),
+    Part(
+        2,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_games(m.read_lines(f)),
+        lambda m, games: sum(m.get_min_powers(games)),
+    ),
+    Part(
+        3,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_array(f),
+        lambda m, array: sum(m.apply_row_slice_callback(array, m.get_part_numbers)),
+    ),
+    Part(
+        3,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_array(f),
+        lambda m, array: sum(m.apply_row_slice_callback(array, m.get_gear_ratios)),
+    ),
+    Part(
+        4,
+        1,
+        "solve.py",
+        lambda m, f: m.get_matches(m.parse_cards(m.read_lines(f))),
+        lambda m, matches: sum(m.get_values(matches)),
+    ),
+    Part(
+        4,
+        2,
+        "solve.py",
+        lambda m, f: m.get_matches(m.parse_cards(m.read_lines(f))),
+        lambda m, matches: sum(m.get_card_counts(matches)),
+    ),
+    Part(
+        5,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_lines(m.read_lines(f)),
+        lambda m, data: min(m.map_seeds(data[1], data[0])),
+    ),
+    Part(
+        5,
+        2,
+        "solve2.py",
+        lambda m, f: m.parse_lines(m.read_lines(f)),
+        lambda m, data: min(m.solve2(data[1], data[0])),
+    ),
+    Part(
+        6,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_races(m.read_lines(f)),
+        lambda m, races: int(np.prod(m.get_win_counts(races))),
+    ),
+    Part(
+        6,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_race(m.read_lines(f)),
+        lambda m, race: m.get_win_count(race),
+        cost=5,
+    ),
+    Part(
+        7,
+        1,
+        "solve.py",
+        read,
+        lambda m, lines: sum(m.get_winnings(m.parse_hands(lines, m.Hand))),
+    ),
+    Part(
+        7,
+        2,
+        "solve.py",
+        read,
+        lambda m, lines: sum(m.get_winnings(m.parse_hands(lines, m.HandVariant))),
+        cost=50,
+    ),
+    Part(
+        8,
+        1,
+        "solve.py",
+        parse_day_8,
+        lambda m, data: m.follow_directions(data[0], data[1]["AAA"]),
+    ),
+    Part(
+        8,
+        2,
+        "solve.py",
+        parse_day_8,
+        lambda m, data: lcm(*m.follow_ghost_directions(data[0], m.get_starts(data[1]))),
+    ),
+    Part(
+        9,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_histories(m.read_lines(f)),
+        lambda m, histories: int(
+            sum(m.get_extrapolations(histories, m.extrapolate_forward))
+        ),
+    ),
+    Part(
+        9,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_histories(m.read_lines(f)),
+        lambda m, histories: int(
+            sum(m.get_extrapolations(histories, m.extrapolate_backward))
+        ),
+    ),
+    Part(
+        10,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_board(f),
+        lambda m, board: m.PipeGraph(board).get_path_length() // 2,
+    ),
+    Part(
+        10,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_board(f),
+        lambda m, board: int(m.PipeGraph(board).get_internal_area()),
+    ),
+    Part(
+        11,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_universe(f),
+        lambda m, universe: int(sum(m.get_distances(m.get_coords(universe)))),
+    ),
+    Part(
+        11,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_universe(f),
+        lambda m, universe: int(sum(m.get_distances(m.get_coords(universe, 999999)))),
+    ),
+    Part(
+        12,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_groups(m.read_lines(f)),
+        lambda m, groups: sum(m.get_counts(groups)),
+    ),
+    Part(
+        12,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_groups(m.read_lines(f)),
+        solve_day_12_unfolded,
+    ),
+    Part(
+        13,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_patterns(f),
+        lambda m, patterns: int(m.get_summary(patterns)),
+    ),
+    Part(
+        13,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_patterns(f),
+        lambda m, patterns: int(m.get_smudge_summary(patterns)),
+    ),
+    Part(
+        14,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_array(f),
+        lambda m, array: int(m.get_load(m.shift_north(array))),
+    ),
+    Part(
+        14,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_array(f),
+        lambda m, array: int(m.get_spin_load(array, 1000000000)),
+    ),
+    Part(
+        15,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_instructions(m.read_lines(f)),
+        lambda m, instructions: sum(m.hash_iterable(instructions)),
+    ),
+    Part(
+        15,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_instructions(m.read_lines(f)),
+        lambda m, instructions: sum(m.get_focus_powers(m.get_boxes(instructions))),
+    ),
+    Part(
+        16,
+        1,
+        "solve.py",
+        lambda m, f: m.Board(m.parse_board(f)),
+        solve_day_16_corner,
+    ),
+    Part(
+        16,
+        2,
+        "solve.py",
+        lambda m, f: m.Board(m.parse_board(f)),
+        lambda m, board: int(board.get_max_energized()),
+    ),
+    Part(
+        17,
+        1,
+        "solve.py",
+        lambda m, f: m.parse_board(f),
+        lambda m, board: int(m.CrucibleGraph(board).get_shortest_path_weight()),
+    ),
+    Part(
+        17,
+        2,
+        "solve.py",
+        lambda m, f: m.parse_board(f),
+        lambda m, board: int(m.CrucibleGraph(board, 4, 10).get_shortest_path_weight()),
+    ),
+    Part(18, 1, "solve.py", parse, lambda m, instructions: int(m.dig(instructions))),
+    Part(19, 1, "solve.py", parse, lambda m, data: m.solve(*data)),
+    Part(19, 2, "solve6.py", parse, lambda m, data: m.solve(*data)),
+    Part(21, 1, "solve1.py", parse_grid, lambda m, board: m.solve(board, 64)),
+    Part(
+        21,
+        2,
+        "solve2.py",
+        parse_grid,
+        lambda m, board: int(m.solve(board, 26501365)),
+        expected=605492675373144,
+    ),
+    Part(22, 1, "solve1.py", parse, lambda m, coords: m.solve(coords), expected=424),
+    Part(
+        22,
+        2,
+        "solve2.py",
+        parse,
+        lambda m, coords: m.solve(coords),
+        expected=55483,
+        cost=40,
+    ),
+    Part(23, 1, "solve1.py", parse_grid, lambda m, board: int(m.solve(board))),
+    Part(
+        23, 2, "solve2.py", parse_grid, lambda m, board: int(m.solve(board)), cost=370
+    ),
+    Part(
+        24,
+        1,
+        "solve1.py",
+        parse,
+        lambda m, pairs: m.solve(pairs, 200000000000000, 400000000000000),
+    ),
+    Part(
+        24,
+        2,
+        "solve2.py",
+        parse,
+        lambda m, pairs: m.solve(pairs, 200000000000000, 400000000000000),
+    ),
+    Part(25, 1, "solve.py", parse, lambda m, graph: m.solve(graph), cost=15),
+]
+
+
+def get_parts(days=None, parts=None):
+    """
+    Filter the registry by day and part number.  None selects everything.
+    """
+    return [
+        part
+        for part in PARTS
+        if (days is None or part.day in days) and (parts is None or part.part in parts)
+    ]
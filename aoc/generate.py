@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+Seeded generators for synthetic puzzle inputs of arbitrary size.
+
+Every generator takes (size, rng) and returns the input text.  size is the
+natural scale of the day:  grid side length for grid days, number of lines
+or records otherwise.  The inputs keep the structural guarantees the solvers
+rely on (closed loops, reachable terminals, non-overlapping bricks, ...).
+
+    python -m aoc.generate 17 500 --seed 1 > big.txt
+"""
+
+import argparse
+import random
+import string
+import sys
+from itertools import product
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+SYMBOLS = "*#+$/@%=&-"
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+DIG_CODES = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def get_loop(height, width, rng):
+    """
+    Return the cells of a closed, non-intersecting loop on a height x width
+    grid, in order.  The loop runs along the top row and then back through a
+    series of random-depth teeth, leaving enclosed cells inside each tooth.
+    """
+    path = [(0, col) for col in range(width)]
+    row, right = 0, width - 1
+    left = right
+    while right >= 5:
+        left = right - rng.randint(3, min(6, right - 1)) + 1
+        depth = rng.randint(2, height - 1)
+        if row == 1:
+            path.append((1, right))
+        path.extend((idx, right) for idx in range(2 if row else 1, depth + 1))
+        path.extend((depth, jdx) for jdx in range(right - 1, left - 1, -1))
+        path.extend((idx, left) for idx in range(depth - 1, 0, -1))
+        row, right = 1, left - 1
+    path.extend((1, jdx) for jdx in range(left - 1, -1, -1))
+    return path
+
+
+def get_directions(src, dst):
+    """
+    Direction of travel between adjacent cells as one of N/S/E/W.
+    """
+    if dst[0] != src[0]:
+        return "S" if dst[0] > src[0] else "N"
+    return "E" if dst[1] > src[1] else "W"
+
+
+def loop_runs(path):
+    """
+    Compress a closed loop into (direction, length) runs of U/D/L/R.
+    """
+    moves = {"N": "U", "S": "D", "E": "R", "W": "L"}
+    runs = []
+    for src, dst in zip(path, path[1:] + path[:1]):
+        move = moves[get_directions(src, dst)]
+        if len(runs) > 0 and runs[-1][0] == move:
+            runs[-1][1] += 1
+        else:
+            runs.append([move, 1])
+    return runs
+
+
+def get_names(count, rng, length=3, alphabet=string.ascii_lowercase):
+    """
+    Return count unique random names, growing the length when exhausted.
+    """
+    while len(alphabet) ** length < count * 2:
+        length += 1
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(alphabet, k=length)))
+    return sorted(names, key=lambda _: rng.random())
+
+
+def grid_str(grid):
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def generate_day_1(size, rng):
+    lines = []
+    for _ in range(size):
+        tokens = rng.choices(WORDS + list(string.ascii_lowercase), k=rng.randint(2, 8))
+        tokens.insert(rng.randint(0, len(tokens)), str(rng.randint(1, 9)))
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_2(size, rng):
+    lines = []
+    for game in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_3(size, rng):
+    grid = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.08:
+                row.extend(str(rng.randint(1, 999)) + ".")
+            elif roll < 0.11:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        grid.append(row[:size])
+    return grid_str(grid)
+
+
+def generate_day_4(size, rng):
+    lines = []
+    for card in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        n_matches = rng.randint(0, min(10, size - card))
+        draws = winning[:n_matches] + others[: 25 - n_matches]
+        rng.shuffle(draws)
+        lines.append(
+            f"Card {card:>4}: {' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in draws)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_5(size, rng):
+    """
+    size is the number of ranges per map.  Each map permutes a partition of
+    the value space, so it is a bijection like the real input.
+    """
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    names += ["humidity", "location"]
+    span = 2**32
+    seeds = []
+    for _ in range(10):
+        seeds += [rng.randrange(span), rng.randint(1, span // 100)]
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    for src, dst in zip(names, names[1:]):
+        lines = [f"{src}-to-{dst} map:"]
+        starts = [0] + sorted(rng.sample(range(1, span), size - 1))
+        ranges = list(zip(starts, starts[1:] + [span]))
+        dst = 0
+        for start, end in rng.sample(ranges, len(ranges)):
+            lines.append(f"{dst} {start} {end - start}")
+            dst += end - start
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections) + "\n"
+
+
+def generate_day_6(size, rng):
+    """
+    size is the number of digits in the concatenated part 2 race time.
+    """
+    times = []
+    while sum(map(len, times)) < size:
+        times.append(str(rng.randint(10, 99)))
+    times[-1] = times[-1][: size - sum(map(len, times[:-1]))]
+    distances = []
+    for time in map(int, times):
+        hold = rng.randint(1, max(1, time - 1))
+        distances.append(str(max(0, hold * (time - hold) - 1)))
+    return f"Time: {'  '.join(times)}\nDistance: {'  '.join(distances)}\n"
+
+
+def generate_day_7(size, rng):
+    lines = []
+    for _ in range(size):
+        cards = "".join(rng.choices("23456789TJQKA", k=5))
+        lines.append(f"{cards} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_8(size, rng):
+    """
+    size is the total number of nodes.  Each ghost walks a chain from its
+    **A node to its **Z node, which loops back to the first chain node so the
+    cycle length equals the distance to Z.
+    """
+    n_ghosts = max(1, min(6, size // 10))
+    alphabet = string.ascii_uppercase[1:-1] + string.digits
+    prefixes = ["AA"] + get_names(n_ghosts - 1, rng, 2, alphabet)
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes[1:]]
+    middles = iter(
+        name
+        for name in get_names(2 * size, rng, 3, alphabet)
+        if name[:2] not in prefixes
+    )
+    lines = []
+    for prefix, end in zip(prefixes, ends):
+        chain = [prefix + "A"]
+        chain += [next(middles) for _ in range(max(1, size // n_ghosts - 2))]
+        chain.append(end)
+        for src, dst in zip(chain, chain[1:] + chain[1:2]):
+            lines.append(f"{src} = ({dst}, {dst})")
+    rng.shuffle(lines)
+    directions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    return directions + "\n\n" + "\n".join(lines) + "\n"
+
+
+def generate_day_9(size, rng):
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * n**k for k, c in enumerate(coefficients)) for n in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_10(size, rng):
+    """
+    size x size grid with one closed loop and random junk pipes.
+    """
+    size = max(size, 6)
+    grid = [
+        rng.choices(".|-LJ7F", weights=(4, 1, 1, 1, 1, 1, 1), k=size)
+        for _ in range(size)
+    ]
+    path = get_loop(size, size, rng)
+    for prev, cell, nxt in zip(path[-1:] + path[:-1], path, path[1:] + path[:1]):
+        directions = {get_directions(cell, prev), get_directions(cell, nxt)}
+        grid[cell[0]][cell[1]] = PIPES[frozenset(directions)]
+    start = rng.choice(path)
+    grid[start[0]][start[1]] = "S"
+    return grid_str(grid)
+
+
+def generate_day_11(size, rng):
+    return grid_str(
+        (
+            rng.choices(".#", weights=(40, 1), k=size)
+            if rng.random() > 0.05
+            else ["."] * size
+        )
+        for _ in range(size)
+    )
+
+
+def generate_day_12(size, rng):
+    lines = []
+    for _ in range(size):
+        springs = rng.choices("#.", k=rng.randint(5, 20))
+        springs[rng.randrange(len(springs))] = "#"
+        groups = [len(run) for run in "".join(springs).split(".") if len(run) > 0]
+        record = "".join(c if rng.random() > 0.5 else "?" for c in springs)
+        lines.append(f"{record} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_pattern(rng):
+    """
+    Pattern with a clean vertical reflection and a row reflection broken by
+    exactly one smudge.
+    """
+    height, width = rng.randint(5, 17), rng.randint(5, 17)
+    grid = [rng.choices("#.", k=width) for _ in range(height)]
+    row = rng.randint(1, height - 1)
+    for idx in range(row):
+        if 2 * row - 1 - idx < height:
+            grid[2 * row - 1 - idx] = grid[idx].copy()
+    col = rng.randint(1, (width - 1) // 2)
+    for line in grid:
+        for jdx in range(col):
+            line[2 * col - 1 - jdx] = line[jdx]
+    idx = rng.randint(max(0, 2 * row - height), row - 1)
+    jdx = rng.randint(2 * col, width - 1)
+    grid[idx][jdx] = "#" if grid[idx][jdx] == "." else "."
+    return grid_str(grid)
+
+
+def generate_day_13(size, rng):
+    return "\n".join(generate_pattern(rng) for _ in range(size))
+
+
+def generate_day_14(size, rng):
+    return grid_str(rng.choices(".O#", weights=(13, 4, 3), k=size) for _ in range(size))
+
+
+def generate_day_15(size, rng):
+    labels = get_names(max(1, size // 4), rng, 2)
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+    return ",".join(steps) + "\n"
+
+
+def generate_day_16(size, rng):
+    return grid_str(
+        rng.choices(".|-/\\", weights=(40, 1, 1, 1, 1), k=size) for _ in range(size)
+    )
+
+
+def generate_day_17(size, rng):
+    return grid_str(rng.choices("123456789", k=size) for _ in range(size))
+
+
+def generate_day_18(size, rng):
+    """
+    Dig plan tracing a closed loop on a size x size grid.  The colour codes
+    trace the same loop scaled up for part 2.
+    """
+    size = max(size, 6)
+    path = get_loop(size, size, rng)
+    scale = rng.randint(1000, 20000)
+    lines = []
+    for move, length in loop_runs(path):
+        lines.append(f"{move} {length} (#{length * scale:05x}{DIG_CODES[move]})")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_19(size, rng):
+    """
+    size is the number of workflows and of parts.  Workflows form a tree
+    rooted at "in" so every part terminates.
+    """
+    pending = [name for name in get_names(size, rng, 3) if name != "in"][: size - 1]
+    names = ["in"]
+    workflows = []
+    for name in names:  # names grows as children are assigned
+        destinations = []
+        for _ in range(rng.randint(2, 4)):
+            if len(pending) > 0 and (rng.random() < 0.7 or name == names[-1]):
+                names.append(pending.pop())
+                destinations.append(names[-1])
+            else:
+                destinations.append(rng.choice("AR"))
+        fallback = destinations.pop()
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{dst}"
+            for dst in destinations
+        ]
+        workflows.append(f"{name}{{{','.join(rules + [fallback])}}}")
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{attr}={rng.randint(1, 4000)}" for attr in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def generate_day_21(size, rng):
+    """
+    Odd size x size garden with clear middle row, column and border like the
+    real input.  Part 2's fixed step count assumes size 131.
+    """
+    size += 1 - size % 2
+    grid = [rng.choices(".#", weights=(9, 1), k=size) for _ in range(size)]
+    center = size // 2
+    for idx in range(size):
+        for jdx in (0, center, size - 1):
+            grid[idx][jdx] = "."
+            grid[jdx][idx] = "."
+    grid[center][center] = "S"
+    return grid_str(grid)
+
+
+def generate_day_22(size, rng):
+    """
+    size non-overlapping bricks over a 10 x 10 footprint.
+
+    The solvers size their height map by the largest coordinate, which must
+    stay at least 10 after settling and after removing any one brick.  The
+    first two bricks are therefore vertical and 10 tall.
+    """
+    occupied = set()
+    lines = []
+    for idx in range(size):
+        axis, length = rng.randrange(3), rng.randint(1, 4)
+        if idx < 2:
+            axis, length = 2, 10
+        src = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, max(2, size // 3))]
+        dst = src.copy()
+        dst[axis] += length - 1
+        if axis < 2 and dst[axis] > 9:
+            src[axis], dst[axis] = 10 - length, 9
+        while True:
+            cells = set(product(*(range(a, b + 1) for a, b in zip(src, dst))))
+            if not cells & occupied:
+                break
+            src[2] += 1
+            dst[2] += 1
+        occupied |= cells
+        lines.append(f"{','.join(map(str, src))}~{','.join(map(str, dst))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_23(size, rng):
+    """
+    size x size lattice of junctions joined by straight trails.  Trails only
+    lead right or down and are guarded by slopes at both ends.  Some trails
+    are removed, keeping a random monotone path from start to end.
+
+    Junctions sit on odd coordinates like the real maze.  23/solve1.py only
+    terminates when trail lengths have that parity.
+    """
+    size = max(size, 2)
+    rows = [rng.choice((3, 5, 7))]
+    cols = [rng.choice((3, 5, 7))]
+    for _ in range(size):
+        rows.append(rows[-1] + rng.choice((4, 6, 8)))
+        cols.append(cols[-1] + rng.choice((4, 6, 8)))
+    grid = [["#"] * (cols[-1] + 1) for _ in range(rows[-1] + 1)]
+    keep = set()
+    idx = jdx = 0
+    while (idx, jdx) != (size - 1, size - 1):
+        step = (
+            (1, 0)
+            if jdx == size - 1 or (idx < size - 1 and rng.random() < 0.5)
+            else (0, 1)
+        )
+        keep.add(((idx, jdx), step))
+        idx, jdx = idx + step[0], jdx + step[1]
+    for idx, jdx in product(range(size), repeat=2):
+        grid[rows[idx]][cols[jdx]] = "."
+        for step, slope in (((0, 1), ">"), ((1, 0), "v")):
+            if idx + step[0] == size or jdx + step[1] == size:
+                continue
+            if ((idx, jdx), step) not in keep and rng.random() < 0.15:
+                continue
+            if step == (0, 1):
+                trail = [(rows[idx], y) for y in range(cols[jdx] + 1, cols[jdx + 1])]
+            else:
+                trail = [(x, cols[jdx]) for x in range(rows[idx] + 1, rows[idx + 1])]
+            for x, y in trail:
+                grid[x][y] = "."
+            for x, y in (trail[0], trail[-1]):
+                grid[x][y] = slope
+    for x in range(rows[0]):
+        grid[x][cols[0]] = "."
+    for x in range(rows[size - 1] + 1, rows[-1] + 1):
+        grid[x][cols[size - 1]] = "."
+    return grid_str(line[: cols[size - 1] + 2] for line in grid)
+
+
+def generate_day_24(size, rng):
+    """
+    size hailstones that a single thrown rock hits at distinct times.
+    """
+    rock = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**11, 10**12), size)
+    lines = []
+    for time in times:
+        velocity = [rng.choice((-1, 1)) * rng.randint(1, 300) for _ in range(3)]
+        position = [
+            p + (rv - v) * time for p, rv, v in zip(rock, rock_velocity, velocity)
+        ]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_25(size, rng):
+    """
+    Two well-connected halves of size // 2 components joined by three wires.
+    """
+    names = get_names(max(size, 8), rng, 3)
+    halves = names[: len(names) // 2], names[len(names) // 2 :]
+    edges = set()
+    for half in halves:
+        for idx, name in enumerate(half):
+            for other in rng.sample(half, min(4, len(half) - 1)) + [half[idx - 1]]:
+                if other != name:
+                    edges.add(tuple(sorted((name, other))))
+    for src, dst in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        edges.add((src, dst))
+    wires = {}
+    for src, dst in edges:
+        wires.setdefault(src, []).append(dst)
+    return "".join(f"{src}: {' '.join(dsts)}\n" for src, dsts in wires.items())
+
+
+GENERATORS = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+    7: generate_day_7,
+    8: generate_day_8,
+    9: generate_day_9,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    21: generate_day_21,
+    22: generate_day_22,
+    23: generate_day_23,
+    24: generate_day_24,
+    25: generate_day_25,
+}
+
+
+def generate(day, size, seed=0):
+    return GENERATORS[day](size, random.Random(f"{day} {size} {seed}"))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sys.stdout.write(generate(args.day, args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
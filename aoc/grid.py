@@ -0,0 +1,65 @@
+"""
+Compact grid representation shared by the grid days.
+
+A grid is a 2-D uint8 array holding the input bytes, one byte per cell.  Cells
+are compared against byte codes (board == HASH) rather than string literals,
+and text is only built when a grid is rendered.
+"""
+
+import numpy as np
+
+from aoc.inputs import read_grid
+
+DOT = ord(".")
+HASH = ord("#")
+
+OFFSETS = ((0, 1), (0, -1), (1, 0), (-1, 0))  # east, west, south, north
+
+
+def codes(chars):
+    """
+    Byte codes of chars as an array, for use with np.isin.
+    """
+    return np.frombuffer(chars.encode("ascii"), dtype=np.uint8)
+
+
+def pad(grid, width=1, fill=DOT):
+    return np.pad(grid, width, constant_values=fill)
+
+
+def load(filename, width=0, fill=DOT):
+    """
+    Writable grid of the input, optionally padded by width cells of fill.
+    """
+    grid = read_grid(filename)
+    return pad(grid, width, fill) if width > 0 else grid.copy()
+
+
+def neighbors(grid, coord):
+    """
+    Yield the in-bounds orthogonal neighbors of coord.
+    """
+    row, col = coord
+    for d_row, d_col in OFFSETS:
+        n_row, n_col = row + d_row, col + d_col
+        if 0 <= n_row < grid.shape[0] and 0 <= n_col < grid.shape[1]:
+            yield n_row, n_col
+
+
+def to_str(grid, table=None):
+    """
+    Render a grid as text.  table optionally maps byte codes to display strings.
+    """
+    if table is None:
+        return "\n".join(row.tobytes().decode("ascii") for row in grid)
+    return "\n".join(
+        "".join(table.get(code, chr(code)) for code in row.tolist()) for row in grid
+    )
+
+
+def count_neighbors(mask):
+    """
+    Number of orthogonal neighbors of each cell that are set in mask.
+    """
+    padded = np.pad(mask, 1, constant_values=False).astype(np.uint8)
+    return padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
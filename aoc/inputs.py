@@ -0,0 +1,137 @@
+"""
+Memory-mapped puzzle input.
+
+The file is mapped read-only and exposed as raw bytes, newline offsets and
+zero-copy 2-D uint8 views for grid inputs.  Views keep the mapping alive, so
+nothing is closed explicitly.  Views are read-only; copy before mutating.
+
+stream_grids reads files of many grids in chunks instead, for inputs too
+large to index up front.
+"""
+
+import io
+import mmap
+
+import numpy as np
+
+NEWLINE = ord("\n")
+
+
+def as_grid(block):
+    """
+    Zero-copy 2-D view of a uint8 block of equal length lines, without a
+    trailing newline.
+    """
+    width = int(np.argmax(block == NEWLINE)) if NEWLINE in block else len(block)
+    height = (len(block) + 1) // (width + 1)
+    if (
+        height * (width + 1) - 1 != len(block)
+        or (block[width :: width + 1] != NEWLINE).any()
+    ):
+        raise ValueError("input lines are not of equal length")
+    return np.lib.stride_tricks.as_strided(
+        block, shape=(height, width), strides=(width + 1, 1), writeable=False
+    )
+
+
+class InputFile:
+    def __init__(self, filename):
+        with open(filename, "rb") as f_in:
+            try:
+                self.buffer = mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files can't be mapped
+                self.buffer = b""
+        self.data = np.frombuffer(self.buffer, dtype=np.uint8)
+        self._newlines = None
+
+    @property
+    def newlines(self):
+        """
+        Offsets of every newline byte.
+        """
+        if self._newlines is None:
+            self._newlines = np.flatnonzero(self.data == NEWLINE)
+        return self._newlines
+
+    @property
+    def line_offsets(self):
+        """
+        (start, end) offsets of each line, excluding the newline.
+        """
+        ends = self.newlines
+        if len(self.data) > 0 and self.data[-1] != NEWLINE:
+            ends = np.append(ends, len(self.data))
+        starts = np.concatenate(([0], self.newlines + 1))[: len(ends)]
+        return np.stack((starts, ends), axis=1)
+
+    def bytes(self):
+        return self.buffer[:]
+
+    def text(self):
+        return self.bytes().decode("utf-8")
+
+    def lines(self):
+        """
+        Same result as readlines() on a file opened in text mode:  decoded
+        lines keeping their newlines, with CRLF and CR line endings read as
+        LF.  Other separators such as form feeds stay inside their line.
+        """
+        return io.StringIO(self.text(), newline=None).readlines()
+
+    def grid(self, start=0, end=None):
+        """
+        Zero-copy uint8 view of the rectangular block of lines in data[start:end].
+        Trailing newlines are ignored.
+        """
+        end = len(self.data) if end is None else end
+        while end > start and self.data[end - 1] == NEWLINE:
+            end -= 1
+        return as_grid(self.data[start:end])
+
+    def grids(self):
+        """
+        Zero-copy views of each blank-line separated grid.
+        """
+        newlines = self.newlines
+        blanks = newlines[1:][np.diff(newlines) == 1]
+        starts = np.concatenate(([0], blanks + 1))
+        ends = np.append(blanks, len(self.data))
+        return [
+            self.grid(start, end) for start, end in zip(starts, ends) if end > start
+        ]
+
+
+def read_text(filename):
+    return InputFile(filename).text()
+
+
+def read_lines(filename):
+    return InputFile(filename).lines()
+
+
+def read_grid(filename):
+    return InputFile(filename).grid()
+
+
+def read_grids(filename):
+    return InputFile(filename).grids()
+
+
+def stream_grids(filename, chunk_size=1 << 20):
+    """
+    Yield each blank-line separated grid like read_grids, but reading the
+    file chunk_size bytes at a time, so memory stays bounded by the chunk
+    and the largest grid however long the file is.
+    """
+    with open(filename, "rb") as f_in:
+        pending = b""
+        while True:
+            chunk = f_in.read(chunk_size)
+            blocks = (pending + chunk).split(b"\n\n")
+            pending = blocks.pop() if len(chunk) > 0 else b""
+            for block in blocks:
+                block = block.strip(b"\n")
+                if len(block) > 0:
+                    yield as_grid(np.frombuffer(block, dtype=np.uint8))
+            if len(chunk) == 0:
+                return
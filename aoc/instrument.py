@@ -0,0 +1,97 @@
+"""
+Opt-in instrumentation for the solvers.
+
+Solvers time phases with named spans and bump named counters:
+
+    @instrument.timed()
+    def build_graph(self):
+        ...
+
+    with instrument.span("search"):
+        ...
+
+    instrument.count("nodes expanded", expanded)
+
+Totals accumulate in the current process until reset().  The runner resets
+before each part and attaches snapshot() to the part's result, so stats come
+back from pool workers along with the answer and can be reported together.
+Spans are meant for phases, not inner loops; count inside a loop with a local
+and report the total once.
+"""
+
+import cProfile
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+_SPANS = defaultdict(lambda: [0, 0.0])
+_COUNTERS = defaultdict(int)
+
+
+@contextmanager
+def span(name):
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        record = _SPANS[name]
+        record[0] += 1
+        record[1] += perf_counter() - start
+
+
+def timed(name=None):
+    """
+    Decorator wrapping each call in a span, named after the function by
+    default.
+    """
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name, value=1):
+    _COUNTERS[name] += value
+
+
+def reset():
+    _SPANS.clear()
+    _COUNTERS.clear()
+
+
+def snapshot():
+    """
+    Copy of the current totals:  {"spans": {name: (calls, seconds)},
+    "counters": {name: value}}.
+    """
+    return {
+        "spans": {name: tuple(record) for name, record in _SPANS.items()},
+        "counters": dict(_COUNTERS),
+    }
+
+
+@contextmanager
+def profile(path=None):
+    """
+    Run the block under cProfile and dump the stats to path.  Does nothing when
+    path is None.
+    """
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
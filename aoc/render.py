@@ -0,0 +1,68 @@
+"""
+Rate-limited rendering of solver progress.
+
+Solvers offer frames from their hot loops and a background thread renders the
+most recent one, at most fps times per second.  Frames offered while one is
+not due are dropped without being built, so rendering never slows the solver
+down by more than the cost of building fps frames per second.
+
+    with FrameRenderer(lambda board: grid.to_str(board), fps=20) as renderer:
+        ...
+        renderer.submit(board.copy)
+"""
+
+import sys
+import threading
+from time import perf_counter
+
+
+class FrameRenderer:
+    def __init__(self, render=str, fps=30, out=None):
+        self.render = render
+        self.interval = 1 / fps
+        self.out = out or sys.stdout
+        self._next = 0
+        self._frame = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._consume, daemon=True)
+        self._thread.start()
+
+    def submit(self, make_frame):
+        """
+        Offer a frame.  make_frame is only called when a frame is due, so it
+        can take a snapshot of the solver state.
+        """
+        now = perf_counter()
+        if now < self._next:
+            return
+        self._next = now + self.interval
+        frame = make_frame()
+        with self._condition:
+            self._frame = frame
+            self._condition.notify()
+
+    def close(self):
+        """
+        Render any pending frame and stop the consumer thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _consume(self):
+        while True:
+            with self._condition:
+                while self._frame is None and not self._closed:
+                    self._condition.wait()
+                frame, self._frame = self._frame, None
+                if frame is None:
+                    return
+            print(self.render(frame), file=self.out, flush=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
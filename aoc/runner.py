@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Run the day solvers in a single process.
+
+Each solver script is imported once and its parts are called directly, so
+numpy/networkx/z3 are only imported a single time per run.
+
+    python -m aoc.runner                  # every day, both parts
+    python -m aoc.runner 13 17 --parts 2  # selected days/parts
+    python -m aoc.runner --parallel       # parts fanned out over all cores
+    python -m aoc.runner 17 --stats       # spans and counters per part
+    python -m aoc.runner 17 --profile .   # cProfile dump per part
+
+Answers are cached on disk (see aoc.cache), so parts whose input, solver and
+parameters are unchanged are not solved again.  --no-cache bypasses the
+cache, as do --stats and --profile.
+"""
+
+import argparse
+import importlib.util
+import os
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+from aoc import instrument
+from aoc.cache import ResultCache, get_key
+from aoc.days import get_parts
+
+_MODULES = {}
+
+
+@dataclass
+class Result:
+    day: int
+    part: int
+    answer: object
+    parse_seconds: float
+    solve_seconds: float
+    peak_rss: float
+    expected: object = None
+    stats: dict = None
+    cached: bool = False
+
+    @property
+    def seconds(self):
+        return self.parse_seconds + self.solve_seconds
+
+    @property
+    def failed(self):
+        return self.expected is not None and self.answer != self.expected
+
+    def __str__(self):
+        status = f"  FAILED expected {self.expected}" if self.failed else ""
+        timing = "cached" if self.cached else f"{self.seconds:.3f}s"
+        return (
+            f"day {self.day:>2} part {self.part}:  {self.answer}"
+            f"  ({timing}, {self.peak_rss:.1f} MB){status}"
+        )
+
+
+def load_module(path):
+    """
+    Import a solver script by path, caching the module for later parts.
+    """
+    if path not in _MODULES:
+        name = f"day{path.parent.name}_{path.stem}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module  # dataclasses resolve their module by name
+        spec.loader.exec_module(module)
+        _MODULES[path] = module
+    return _MODULES[path]
+
+
+def reset_peak_rss():
+    """
+    Restart the peak RSS measurement, so get_peak_rss covers one part.  This
+    needs Linux's /proc/self/clear_refs; elsewhere it does nothing.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f_out:
+            f_out.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss():
+    """
+    Peak resident set size in MB since the last reset_peak_rss, read from
+    VmHWM in /proc/self/status.  Where that isn't available this falls back
+    to the high-water mark of the whole process, which only grows as parts
+    run.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f_in:
+            for line in f_in:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return get_process_peak_rss()
+
+
+def get_process_peak_rss():
+    """
+    Peak resident set size of this process in MB over its whole life.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def get_profile_path(part, profile_dir):
+    if profile_dir is None:
+        return None
+    return Path(profile_dir) / f"day{part.day}_part{part.part}.prof"
+
+
+def run_part(part, filename="input.txt", profile_dir=None, cache=None):
+    module = load_module(part.path)
+    input_path = part.get_input(filename)
+    expected = part.expected if filename == "input.txt" else None
+    reset_peak_rss()
+    if cache is not None:
+        key = get_key(part, module, input_path)
+        entry = cache.get(key)
+        if entry is not None:
+            return Result(
+                part.day,
+                part.part,
+                entry["answer"],
+                0,
+                0,
+                get_peak_rss(),
+                expected,
+                cached=True,
+            )
+    instrument.reset()
+    with instrument.profile(get_profile_path(part, profile_dir)):
+        start = perf_counter()
+        data = part.parse(module, str(input_path))
+        parsed = perf_counter()
+        answer = part.solve(module, data)
+        solved = perf_counter()
+    if cache is not None:
+        cache.put(key, {"answer": answer})
+    return Result(
+        part.day,
+        part.part,
+        answer,
+        parsed - start,
+        solved - parsed,
+        get_peak_rss(),
+        expected,
+        instrument.snapshot(),
+    )
+
+
+def run(parts, filename="input.txt", profile_dir=None, cache=None):
+    results = []
+    for part in parts:
+        result = run_part(part, filename, profile_dir, cache)
+        print(result)
+        results.append(result)
+    return results
+
+
+def run_key(day, part_number, filename, profile_dir=None, cache=None):
+    """
+    Pool worker entry point.  Parts hold lambdas and can't be pickled, so
+    workers look them up in the registry by key instead.
+    """
+    (part,) = get_parts([day], [part_number])
+    return run_part(part, filename, profile_dir, cache)
+
+
+def run_parallel(parts, filename="input.txt", jobs=None, profile_dir=None, cache=None):
+    """
+    Run parts across a process pool, longest first so the total wall-clock
+    approaches that of the slowest part rather than the sum.  Each worker
+    imports a solver at most once.
+    """
+    parts = sorted(parts, key=lambda part: part.cost, reverse=True)
+    results = []
+    with ProcessPoolExecutor(jobs or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(run_key, part.day, part.part, filename, profile_dir, cache)
+            for part in parts
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            print(result)
+            results.append(result)
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def report(results, elapsed):
+    total = sum(result.seconds for result in results)
+    peak_rss = max([get_process_peak_rss()] + [result.peak_rss for result in results])
+    print(f"total:  {total:.3f}s  wall:  {elapsed:.3f}s  peak rss:  {peak_rss:.1f} MB")
+    failed = [result for result in results if result.failed]
+    if len(failed) > 0:
+        print(f"failed:  {', '.join(f'{r.day}.{r.part}' for r in failed)}")
+    return len(failed) == 0
+
+
+def report_stats(results):
+    """
+    Print the spans, slowest first, and counters recorded by each part.
+    """
+    for result in results:
+        if result.stats is None or not any(result.stats.values()):
+            continue
+        print(f"day {result.day} part {result.part}:")
+        spans = sorted(result.stats["spans"].items(), key=lambda item: -item[1][1])
+        for name, (calls, seconds) in spans:
+            print(f"  {name:<48} {seconds:9.3f}s  {calls:>9} calls")
+        for name, value in sorted(result.stats["counters"].items()):
+            print(f"  {name:<48} {value:>10}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("days", nargs="*", type=int, help="days to run, default all")
+    parser.add_argument("--parts", nargs="+", type=int, choices=(1, 2))
+    parser.add_argument("--input", default="input.txt", help="file in each day dir")
+    parser.add_argument("--parallel", action="store_true", help="use a process pool")
+    parser.add_argument("--jobs", type=int, help="pool size, default cpu count")
+    parser.add_argument("--stats", action="store_true", help="print spans/counters")
+    parser.add_argument("--profile", metavar="DIR", help="dump cProfile stats")
+    parser.add_argument("--no-cache", action="store_true", help="always re-solve")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    parts = get_parts(args.days or None, args.parts)
+    if args.profile:
+        Path(args.profile).mkdir(parents=True, exist_ok=True)  # before any solving
+    # cached results carry no stats or profile, so those re-solve every part
+    bypass_cache = args.no_cache or args.stats or args.profile
+    cache = None if bypass_cache else ResultCache()
+    start = perf_counter()
+    if args.parallel:
+        results = run_parallel(parts, args.input, args.jobs, args.profile, cache)
+    else:
+        results = run(parts, args.input, args.profile, cache)
+    elapsed = perf_counter() - start
+    if args.stats:
+        report_stats(results)
+    return 0 if report(results, elapsed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())